@@ -0,0 +1,284 @@
+"""Local fake of the WordPress.org API for benchmarks.
+
+Serves every endpoint of the tap with generated payloads of the requested
+size, or of a fixed number of days, after a simulated latency. Payloads only
+depend on the endpoint and the size, so they are generated once. Like
+WordPress.org, payloads are gzip compressed when the request accepts it.
+
+Usage:
+    python benchmarks/fake_wordpress.py [port] [latency seconds]
+"""
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_LIMIT: int = 730
+
+# Compression level of the gzip responses
+GZIP_LEVEL: int = 6
+
+
+def series(limit: int, percentage: bool = False) -> dict:
+    """Create a daily series payload.
+
+    Arguments:
+        limit {int} -- Number of days
+
+    Keyword Arguments:
+        percentage {bool} -- Percentages instead of counts (default: {False})
+
+    Returns:
+        dict -- Series of date: value, up to today
+    """
+    first: date = date.today() - timedelta(days=limit - 1)
+    return {
+        str(first + timedelta(days=day)): (
+            f'{day % 7 - 3}.{day % 10}' if percentage else str(1000 + day)
+        )
+        for day in range(limit)
+    }
+
+
+def plugin_information(slug: str) -> dict:
+    """Create a plugin_information payload.
+
+    Arguments:
+        slug {str} -- Plugin
+
+    Returns:
+        dict -- Plugin metadata
+    """
+    return {
+        'name': slug.title(),
+        'slug': slug,
+        'version': '1.0.0',
+        'requires': '5.0',
+        'tested': '5.8',
+        'requires_php': '7.0',
+        'added': '2010-01-01',
+        'last_updated': '2021-01-01 1:00pm GMT',
+        'homepage': f'https://example.org/{slug}',
+        'active_installs': 10000,
+        'downloaded': 1000000,
+        'rating': 90,
+        'num_ratings': 100,
+        'ratings': {'1': 5, '2': 5, '3': 10, '4': 20, '5': 60},
+        'support_threads': 10,
+        'support_threads_resolved': 8,
+        'sections': {'description': '<p>Description</p>'},
+        'versions': {'1.0.0': f'https://example.org/{slug}.1.0.0.zip'},
+    }
+
+
+class FakeWordPress(object):
+    """Fake WordPress.org API on a local port, run in a thread."""
+
+    def __init__(
+        self,
+        latency: float = 0,
+        port: int = 0,
+        days: Optional[int] = None,
+        compress: bool = True,
+    ) -> None:
+        """Initialize the server.
+
+        Keyword Arguments:
+            latency {float} -- Seconds before every response (default: {0})
+            port {int} -- Port, 0 for any free port (default: {0})
+            days {Optional[int]} -- Days of every series, instead of the
+                requested limit (default: {None})
+            compress {bool} -- Compress the responses with gzip when the
+                request accepts it (default: {True})
+        """
+        self.latency: float = latency
+        self.days: Optional[int] = days
+        self.compress: bool = compress
+        self.requests: int = 0
+        self.bytes: int = 0
+        self._payloads: Dict[Tuple[str, int, bool], bytes] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ('127.0.0.1', port),
+            self._handler(),
+        )
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server.
+
+        Returns:
+            str -- Base URL
+        """
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'FakeWordPress':
+        """Start serving.
+
+        Returns:
+            FakeWordPress -- The server
+        """
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: tuple) -> None:
+        """Stop serving.
+
+        Arguments:
+            exc_info {tuple} -- Exception info
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(
+        self,
+        latency: Optional[float] = None,
+        days: Optional[int] = None,
+    ) -> None:
+        """Reset the counters.
+
+        Keyword Arguments:
+            latency {Optional[float]} -- New latency (default: {None})
+            days {Optional[int]} -- New days of every series (default: {None})
+        """
+        with self._lock:
+            self.requests = 0
+            self.bytes = 0
+        if latency is not None:
+            self.latency = latency
+        if days is not None:
+            self.days = days
+
+    def payload(self, path: str, query: dict, gzipped: bool) -> bytes:
+        """Return the payload of a request.
+
+        Arguments:
+            path {str} -- Path
+            query {dict} -- Query parameters
+            gzipped {bool} -- Compress the payload with gzip
+
+        Returns:
+            bytes -- JSON payload
+        """
+        slug: str = query.get('slug', query.get('request[slug]', ['']))[0]
+        limit: int = self.days or int(query.get('limit', [DEFAULT_LIMIT])[0])
+
+        if 'action' in query:
+            body: bytes = json.dumps({
+                'info': {'page': 1, 'pages': 1, 'results': 0},
+                'plugins': [],
+            }).encode()
+            if query['action'][0] == 'plugin_information':
+                body = json.dumps(plugin_information(slug)).encode()
+            return gzip.compress(body, GZIP_LEVEL) if gzipped else body
+
+        # Slug independent payloads are generated once
+        key: Tuple[str, int, bool] = (path, limit, gzipped)
+        if 'historical_summary' in query:
+            key = ('historical_summary', 0, gzipped)
+        if key not in self._payloads:
+            body = json.dumps(self._generate(path, query, limit)).encode()
+            if gzipped:
+                body = gzip.compress(body, GZIP_LEVEL)
+            self._payloads[key] = body
+        return self._payloads[key]
+
+    def _generate(self, path: str, query: dict, limit: int) -> dict:
+        """Generate a slug independent payload.
+
+        Arguments:
+            path {str} -- Path
+            query {dict} -- Query parameters
+            limit {int} -- Number of days
+
+        Returns:
+            dict -- Payload
+        """
+        if 'historical_summary' in query:
+            return {
+                'today': '10',
+                'yesterday': '100',
+                'last_week': '700',
+                'all_time': '100000',
+            }
+        if path.endswith('downloads.php'):
+            return series(limit)
+        if path.endswith('active-installs.php'):
+            return series(limit, percentage=True)
+        return {'5.8': 40.123456, '5.7': 30.5, '5.6': 29.376544}
+
+    def _handler(self) -> type:
+        """Create the request handler class of the server.
+
+        Returns:
+            type -- Request handler class
+        """
+        fake: FakeWordPress = self
+
+        class Handler(BaseHTTPRequestHandler):  # noqa: WPS431
+            protocol_version: str = 'HTTP/1.1'
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlsplit(self.path)
+                gzipped: bool = fake.compress and 'gzip' in self.headers.get(
+                    'Accept-Encoding',
+                    '',
+                )
+                body: bytes = fake.payload(
+                    url.path,
+                    parse_qs(url.query),
+                    gzipped,
+                )
+
+                if fake.latency:
+                    time.sleep(fake.latency)
+                with fake._lock:  # noqa: WPS437
+                    fake.requests += 1
+                    fake.bytes += len(body)
+
+                self.send_response(200)  # noqa: WPS432
+                self.send_header('Content-Type', 'application/json')
+                if gzipped:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: tuple) -> None:
+                """Do not log requests.
+
+                Arguments:
+                    args {tuple} -- Log arguments
+                """
+
+        return Handler
+
+
+def main() -> None:
+    """Serve until interrupted."""
+    port: int = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    latency: float = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    with FakeWordPress(latency, port) as fake:
+        print(f'Serving on {fake.url}, set "api_base_url" to use it')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print(f'{fake.requests} requests, {fake.bytes} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the info payload with and without field flags.
+
+Requests the plugin information of every plugin by its slug from the
+WordPress.org API, as the info stream does, once with all default fields,
+once with only the fields that the info stream needs and once with the
+fields of the info, plugin_information and plugin_versions streams, which
+share the payload. Reports the bytes per request and the JSON decode time.
+
+Usage:
+    python benchmarks/info_fields.py [plugin ...]
+"""
+# -*- coding: utf-8 -*-
+import json
+import sys
+import time
+from typing import List, Tuple
+
+import httpx
+
+from tap_wordpress_plugin_stats.streams import STREAMS
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    API_BASE_PATH,  # noqa: I001
+    ENDPOINT_PLUGIN_INFORMATION,  # noqa: I001
+    headers,  # noqa: I001
+    info_fields,  # noqa: I001
+)  # noqa: I001
+
+DEFAULT_PLUGINS: tuple = ('wordpress-seo', 'akismet', 'jetpack')
+
+# Streams that are loaded from the plugin information payload
+SHARED_STREAMS: tuple = ('info', 'plugin_information', 'plugin_versions')
+
+
+def measure(
+    client: httpx.Client,
+    plugins: List[str],
+    fields: str,
+) -> Tuple[int, float]:
+    """Measure the average bytes and decode time per request.
+
+    Arguments:
+        client {httpx.Client} -- HTTP client
+        plugins {List[str]} -- Plugins
+        fields {str} -- Field flags query string
+
+    Returns:
+        Tuple[int, float] -- Bytes and decode milliseconds per request
+    """
+    size: int = 0
+    decode: float = 0
+
+    for plugin in plugins:
+        path: str = ENDPOINT_PLUGIN_INFORMATION.replace(
+            ':plugin:',
+            plugin,
+        ) + fields
+        response: httpx.Response = client.get(f'{API_BASE_PATH}{path}')
+        response.raise_for_status()
+        size += len(response.content)
+
+        start: float = time.perf_counter()
+        json.loads(response.content)
+        decode += time.perf_counter() - start
+
+    return size // len(plugins), decode * 1000 / len(plugins)
+
+
+def main() -> None:
+    """Run benchmark."""
+    plugins: List[str] = sys.argv[1:] or list(DEFAULT_PLUGINS)
+    queries: tuple = (
+        ('all', ''),
+        ('info', info_fields(STREAMS['info'].get('mapping', {}))),
+        ('shared', info_fields(*[
+            STREAMS[stream].get('mapping', {}) for stream in SHARED_STREAMS
+        ])),
+    )
+
+    with httpx.Client(http2=True, headers=dict(headers)) as client:
+        print(f'{"request":<8} {"bytes":>10} {"decode ms":>10}')
+        for name, query in queries:
+            size, decode = measure(client, plugins, query)
+            print(f'{name:<8} {size:>10} {decode:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
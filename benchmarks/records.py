@@ -0,0 +1,121 @@
+"""Benchmark the allocations of the cleaning path.
+
+Compares the previous cleaning path, which builds a dictionary per row in the
+fetcher and another one in clean_row, with the compact record path.
+
+Usage:
+    python benchmarks/records.py [number of rows]
+"""
+# -*- coding: utf-8 -*-
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+from tap_wordpress_plugin_stats.cleaners import CLEANERS, to_type_or_null
+from tap_wordpress_plugin_stats.streams import STREAMS
+
+DEFAULT_ROWS: int = 200000
+
+
+def payload(rows: int) -> dict:
+    """Create a fake downloads.php payload.
+
+    Arguments:
+        rows {int} -- Number of rows
+
+    Returns:
+        dict -- Payload
+    """
+    start: date = date(2000, 1, 1)
+    return {
+        str(start + timedelta(days=day)): str(day * 7)
+        for day in range(rows)
+    }
+
+
+def dict_path(response: dict) -> List[dict]:
+    """Clean the payload using a dictionary per row.
+
+    Arguments:
+        response {dict} -- Payload
+
+    Returns:
+        List[dict] -- Cleaned rows
+    """
+    mapping: dict = STREAMS['downloads']['mapping']
+    records: List[dict] = [
+        {
+            'date': key,
+            'downloads': download,
+            'plugin': 'wordpress-seo',
+        } for key, download in response.items()
+    ]
+    return [
+        {
+            key_mapping.get('map') or key: to_type_or_null(
+                record[key],
+                key_mapping.get('type'),
+                key_mapping.get('null', True),
+            )
+            for key, key_mapping in mapping.items()
+        }
+        for record in records
+    ]
+
+
+def record_path(response: dict) -> List[tuple]:
+    """Clean the payload using compact records.
+
+    Arguments:
+        response {dict} -- Payload
+
+    Returns:
+        List[tuple] -- Cleaned records
+    """
+    cleaner: Callable = CLEANERS['downloads']
+    records: List[tuple] = []
+    row: dict = {'plugin': 'wordpress-seo'}
+    for key, download in response.items():
+        row['date'] = key
+        row['downloads'] = download
+        records.append(cleaner(row))
+    return records
+
+
+def measure(path: Callable, response: dict) -> Tuple[float, int]:
+    """Measure the duration and peak memory of a cleaning path.
+
+    Arguments:
+        path {Callable} -- Cleaning path
+        response {dict} -- Payload
+
+    Returns:
+        Tuple[float, int] -- Seconds and peak bytes
+    """
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    path(response)
+    duration: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    """Run benchmark."""
+    rows: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    response: dict = payload(rows)
+
+    print(f'{"path":<8} {"seconds":>10} {"peak MiB":>10} {"bytes/row":>10}')
+    for name, path in (('dict', dict_path), ('record', record_path)):
+        duration, peak = measure(path, response)
+        print(
+            f'{name:<8} {duration:>10.3f} {peak / 2 ** 20:>10.1f} '
+            f'{peak // rows:>10}',
+        )
+
+
+if __name__ == '__main__':
+    main()
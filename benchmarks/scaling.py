@@ -0,0 +1,311 @@
+"""Benchmark how the tap scales with plugins, concurrency and latency.
+
+Runs the full tap, tap.main with its output on stdout, against a local fake
+WordPress.org API (see fake_wordpress.py) for every combination of plugin
+count, concurrency, decode workers, payload limit and simulated latency.
+Reports the wall time, requests/s, MiB on the wire, records/s and peak memory
+of every run as a table, and optionally as CSV. Responses are gzip compressed
+unless --no-compression is passed. The peak memory is the highest peak of the
+runs so far, so the combinations are best ordered from small to large.
+
+The tap always requests its full history, so the limit is the number of days
+of every series served by the fake API.
+
+With --baseline, the records/s of every run is compared with the stored
+baseline of the same combination, and the benchmark fails when it regressed
+by more than the tolerance. --save-baseline stores the results as the new
+baseline. Baselines are specific to a machine.
+
+Usage:
+    python benchmarks/scaling.py [--plugins 10 100 1000 10000]
+        [--concurrency 1 8] [--decode-workers 0 1] [--limit 30 730]
+        [--latency 0 0.02] [--no-compression]
+        [--streams downloads active_installs] [--csv results.csv]
+        [--baseline benchmarks/scaling_baseline.json] [--save-baseline]
+"""
+# -*- coding: utf-8 -*-
+import csv
+import json
+import os
+import resource
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser, Namespace
+from itertools import product
+from typing import Dict, List, Tuple
+
+from fake_wordpress import FakeWordPress
+
+from tap_wordpress_plugin_stats.discover import discover
+
+COLUMNS: Tuple[str, ...] = (
+    'plugins',
+    'concurrency',
+    'decode_workers',
+    'limit',
+    'latency',
+    'seconds',
+    'requests',
+    'requests_per_second',
+    'wire_mib',
+    'records',
+    'records_per_second',
+    'peak_mib',
+)
+
+# Records/s may drop this much below the baseline
+DEFAULT_TOLERANCE: float = 0.2
+
+KIB_PER_MIB: int = 1024
+BYTES_PER_MIB: int = 2 ** 20
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace -- Arguments
+    """
+    parser: ArgumentParser = ArgumentParser(
+        description='Benchmark how the tap scales.',
+    )
+    parser.add_argument('--plugins', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8])
+    parser.add_argument(
+        '--decode-workers',
+        type=int,
+        nargs='+',
+        default=[1],
+    )
+    parser.add_argument('--limit', type=int, nargs='+', default=[30, 730])
+    parser.add_argument('--latency', type=float, nargs='+', default=[0])
+    parser.add_argument('--streams', nargs='+', default=['downloads'])
+    parser.add_argument(
+        '--no-compression',
+        action='store_true',
+        help='Do not compress the responses of the fake API',
+    )
+    parser.add_argument('--csv', help='Write the results to a CSV file')
+    parser.add_argument('--baseline', help='Baseline JSON file')
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store the results as the baseline',
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help='Allowed records/s regression (default: 0.2)',
+    )
+    return parser.parse_args()
+
+
+def write_catalog(path: str, streams: List[str]) -> None:
+    """Write a catalog with only the given streams selected.
+
+    Arguments:
+        path {str} -- Catalog path
+        streams {List[str]} -- Selected streams
+    """
+    catalog: dict = discover().to_dict()
+    for entry in catalog['streams']:
+        entry['schema']['selected'] = entry['tap_stream_id'] in streams
+
+    with open(path, 'w') as catalog_file:
+        json.dump(catalog, catalog_file)
+
+
+def run_tap(config_path: str, catalog_path: str) -> Tuple[float, int, int]:
+    """Run the tap and count the records on its stdout.
+
+    Arguments:
+        config_path {str} -- Config path
+        catalog_path {str} -- Catalog path
+
+    Returns:
+        Tuple[float, int, int] -- Seconds, records and peak memory in KiB
+    """
+    # The peak memory of the children that were waited for, it is the peak
+    # of this run when it grows
+    peak_before: int = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    start: float = time.perf_counter()
+    process: subprocess.Popen = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'tap_wordpress_plugin_stats.tap',
+            '-c',
+            config_path,
+            '--catalog',
+            catalog_path,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+    records: int = 0
+    for line in process.stdout:  # type: ignore
+        if line.startswith(b'{"type": "RECORD"'):
+            records += 1
+
+    process.wait()
+    duration: float = time.perf_counter() - start
+    if process.returncode:
+        raise RuntimeError(f'The tap exited with {process.returncode}')
+
+    peak: int = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if peak <= peak_before:
+        print(
+            f'The peak memory of the run is at most {peak} KiB, an earlier '
+            'run had a higher peak',
+            file=sys.stderr,
+        )
+    return duration, records, peak
+
+
+def run(  # noqa: WPS210
+    fake: FakeWordPress,
+    directory: str,
+    catalog_path: str,
+    combination: Tuple[int, int, int, int, float],
+) -> dict:
+    """Run the tap for a combination of parameters.
+
+    Arguments:
+        fake {FakeWordPress} -- Fake API
+        directory {str} -- Directory for the config
+        catalog_path {str} -- Catalog path
+        combination {Tuple[int, int, int, int, float]} -- Plugins,
+            concurrency, decode workers, limit and latency
+
+    Returns:
+        dict -- Result
+    """
+    plugins, concurrency, decode_workers, limit, latency = combination
+    config_path: str = os.path.join(directory, 'config.json')
+    with open(config_path, 'w') as config_file:
+        json.dump(
+            {
+                'plugins': [f'plugin-{index}' for index in range(plugins)],
+                'concurrency': concurrency,
+                'decode_workers': decode_workers,
+                'api_base_url': fake.url,
+                'checkpoint_seconds': 0,
+            },
+            config_file,
+        )
+
+    fake.reset(latency, limit)
+    duration, records, peak = run_tap(config_path, catalog_path)
+
+    return {
+        'plugins': plugins,
+        'concurrency': concurrency,
+        'decode_workers': decode_workers,
+        'limit': limit,
+        'latency': latency,
+        'seconds': round(duration, 3),
+        'requests': fake.requests,
+        'requests_per_second': round(fake.requests / duration, 1),
+        'wire_mib': round(fake.bytes / BYTES_PER_MIB, 2),
+        'records': records,
+        'records_per_second': round(records / duration, 1),
+        'peak_mib': round(peak / KIB_PER_MIB, 1),
+    }
+
+
+def result_key(result: dict) -> str:
+    """Return the baseline key of a result.
+
+    Arguments:
+        result {dict} -- Result
+
+    Returns:
+        str -- Key
+    """
+    return '/'.join(str(result[column]) for column in COLUMNS[:5])
+
+
+def regressions(
+    results: List[dict],
+    baseline: Dict[str, float],
+    tolerance: float,
+) -> List[str]:
+    """Return the runs that regressed against the baseline.
+
+    Arguments:
+        results {List[dict]} -- Results
+        baseline {Dict[str, float]} -- Records/s per result key
+        tolerance {float} -- Allowed regression
+
+    Returns:
+        List[str] -- Description of every regression
+    """
+    failed: List[str] = []
+    for result in results:
+        expected: float = baseline.get(result_key(result), 0)
+        if result['records_per_second'] < expected * (1 - tolerance):
+            failed.append(
+                f'{result_key(result)}: {result["records_per_second"]} '
+                f'records/s, baseline {expected}',
+            )
+    return failed
+
+
+def main() -> None:  # noqa: WPS210
+    """Run benchmark."""
+    args: Namespace = parse_args()
+    results: List[dict] = []
+
+    print(' '.join(f'{column:>19}' for column in COLUMNS))
+
+    with tempfile.TemporaryDirectory() as directory:
+        catalog_path: str = os.path.join(directory, 'catalog.json')
+        write_catalog(catalog_path, args.streams)
+
+        with FakeWordPress(compress=not args.no_compression) as fake:
+            for combination in product(
+                args.plugins,
+                args.concurrency,
+                args.decode_workers,
+                args.limit,
+                args.latency,
+            ):
+                result: dict = run(fake, directory, catalog_path, combination)
+                results.append(result)
+                print(' '.join(f'{result[column]:>19}' for column in COLUMNS))
+
+    if args.csv:
+        with open(args.csv, 'w', newline='') as csv_file:
+            writer: csv.DictWriter = csv.DictWriter(csv_file, COLUMNS)
+            writer.writeheader()
+            writer.writerows(results)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(
+                {
+                    result_key(result): result['records_per_second']
+                    for result in results
+                },
+                baseline_file,
+                indent=2,
+            )
+    elif args.baseline:
+        with open(args.baseline) as baseline_file:
+            failed: List[str] = regressions(
+                results,
+                json.load(baseline_file),
+                args.tolerance,
+            )
+        if failed:
+            print('Throughput regressed:\n' + '\n'.join(failed))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
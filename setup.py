@@ -14,9 +14,17 @@ setup(
         'httpx[http2]~=0.17.0',
         'singer-python~=5.12.0',
     ],
+    extras_require={
+        'compression': [
+            'brotli>=1.0',
+            'zstandard>=0.15',
+        ],
+    },
     entry_points="""
         [console_scripts]
         tap-wordpress-plugin-stats=tap_wordpress_plugin_stats:main
+        tap-wordpress-plugin-stats-multi=tap_wordpress_plugin_stats.multi:main
+        tap-wordpress-plugin-stats-daemon=tap_wordpress_plugin_stats.daemon:main
     """,
     packages=find_packages(),
     package_data={
@@ -0,0 +1,139 @@
+"""Aggregates of daily series."""
+# -*- coding: utf-8 -*-
+from array import array
+from datetime import date, timedelta
+from operator import sub
+from typing import Callable, Generator, List, Tuple
+
+DAYS_PER_WEEK: int = 7
+MONTHS_PER_YEAR: int = 12
+
+
+def week_start(day: date) -> date:
+    """Return the Monday of the week of a day.
+
+    Arguments:
+        day {date} -- Day
+
+    Returns:
+        date -- Monday
+    """
+    return day - timedelta(day.weekday())
+
+
+def next_week(day: date) -> date:
+    """Return the Monday after the week of a Monday.
+
+    Arguments:
+        day {date} -- Monday
+
+    Returns:
+        date -- Next Monday
+    """
+    return day + timedelta(DAYS_PER_WEEK)
+
+
+def month_start(day: date) -> date:
+    """Return the first day of the month of a day.
+
+    Arguments:
+        day {date} -- Day
+
+    Returns:
+        date -- First day of the month
+    """
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    """Return the first day of the month after a first day of the month.
+
+    Arguments:
+        day {date} -- First day of a month
+
+    Returns:
+        date -- First day of the next month
+    """
+    if day.month == MONTHS_PER_YEAR:
+        return day.replace(year=day.year + 1, month=1)
+    return day.replace(month=day.month + 1)
+
+
+def dense(series: dict) -> Tuple[date, array, array]:
+    """Convert a series of date: value to dense arrays.
+
+    Arguments:
+        series {dict} -- Series of date: value
+
+    Returns:
+        Tuple[date, array, array] -- First date, values (0 on days without
+            data) and whether the day has data
+    """
+    days: List[date] = [date.fromisoformat(day) for day in series]
+    start: date = min(days)
+    length: int = (max(days) - start).days + 1
+
+    values: array = array('q', bytes(length * array('q').itemsize))
+    present: array = array('b', bytes(length))
+
+    for day, input_value in zip(days, series.values()):
+        values[(day - start).days] = int(input_value)
+        present[(day - start).days] = 1
+
+    return start, values, present
+
+
+def totals(
+    series: dict,
+    period_start: Callable[[date], date],
+    next_period: Callable[[date], date],
+) -> Generator:
+    """Yield the total of a series per period.
+
+    The series is made dense once, and every total is a sum over a slice of
+    the dense arrays, so the days are not looked up by date per period.
+
+    Arguments:
+        series {dict} -- Series of date: value
+        period_start {Callable[[date], date]} -- Returns the period of a day
+        next_period {Callable[[date], date]} -- Returns the next period
+
+    Yields:
+        Generator -- Tuple of period, total and number of days with data
+    """
+    if not series:
+        return
+
+    start, values, present = dense(series)
+    end: date = start + timedelta(len(values))
+    period: date = period_start(start)
+
+    while period < end:
+        following: date = next_period(period)
+        first: int = max((period - start).days, 0)
+        last: int = (following - start).days
+
+        yield period, sum(values[first:last]), sum(present[first:last])
+
+        period = following
+
+
+def deltas(series: dict) -> Generator:
+    """Yield every value of a series and the change since the previous value.
+
+    Days without data are skipped, so a change can span more than one day.
+
+    Arguments:
+        series {dict} -- Series of date: value, values may end with + or -
+
+    Yields:
+        Generator -- Tuple of date, value and change, None for the first date
+    """
+    days: List[str] = sorted(series)
+    values: array = array('d', (
+        float(str(series[day]).rstrip('-').rstrip('+')) for day in days
+    ))
+    changes: array = array('d', map(sub, values[1:], values[:-1]))
+
+    for index, day in enumerate(days):
+        yield day, values[index], changes[index - 1] if index else None
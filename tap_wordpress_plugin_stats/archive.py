@@ -0,0 +1,566 @@
+"""Memory-mapped archive of daily series."""
+# -*- coding: utf-8 -*-
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from typing import BinaryIO, Dict, Generator, List, Optional, Tuple
+
+# File layout, little or big endian as the machine that wrote it:
+# - header: magic, version, byte order, number of series, index offset
+# - data: per series a dense array of daily values followed by room for
+#   later days, aligned to 8 bytes
+# - index: per series the slug, type code, first date, length, capacity and
+#   offset
+MAGIC: bytes = b'WPSA'
+VERSION: int = 2
+HEADER: struct.Struct = struct.Struct('=4sHcIQ')
+ENTRY: struct.Struct = struct.Struct('=HcIIIQ')
+ALIGNMENT: int = 8
+
+# Days reserved after the last day of a series, so that the daily updates of
+# a year are written in place
+SLACK_DAYS: int = 366
+
+# Value of days without data
+MISSING: dict = {'i': -1, 'd': float('nan')}
+
+BYTE_ORDERS: dict = {'little': b'<', 'big': b'>'}
+
+
+class ArchiveError(ValueError):
+    """Archive can not be read."""
+
+
+def present(typecode: str, input_value: float) -> bool:
+    """Return whether an archived value is not missing.
+
+    Arguments:
+        typecode {str} -- Array type code, 'i' or 'd'
+        input_value {float} -- Archived value
+
+    Returns:
+        bool -- Whether the day has data
+    """
+    if typecode == 'i':
+        return input_value != MISSING['i']
+
+    # NaN is the only value that is not equal to itself
+    return input_value == input_value  # noqa: WPS312
+
+
+def _dense(series: dict, typecode: str) -> Tuple[date, array]:
+    """Convert a series of date: value to a dense array.
+
+    Arguments:
+        series {dict} -- Series of date: value
+        typecode {str} -- Array type code, 'i' or 'd'
+
+    Returns:
+        Tuple[date, array] -- First date and values
+    """
+    days: List[date] = sorted(date.fromisoformat(day) for day in series)
+    start: date = days[0]
+    values: array = array(
+        typecode,
+        [MISSING[typecode]] * ((days[-1] - start).days + 1),
+    )
+    convert: type = int if typecode == 'i' else float
+
+    for day, input_value in series.items():
+        values[(date.fromisoformat(day) - start).days] = convert(input_value)
+
+    return start, values
+
+
+def _merge(target: memoryview, base: int, values: array) -> None:
+    """Write the days with data of values into target, from base.
+
+    Arguments:
+        target {memoryview} -- Archived values, or an array
+        base {int} -- Position of the first value in target
+        values {array} -- New values, missing days are not written
+    """
+    typecode: str = values.typecode
+    holes: bool = not all(
+        present(typecode, input_value) for input_value in values
+    )
+
+    # Series without holes are copied at once
+    if not holes:
+        target[base:base + len(values)] = values
+        return
+
+    for position, input_value in enumerate(values):
+        if present(typecode, input_value):
+            target[base + position] = input_value
+
+
+def _aligned(offset: int) -> int:
+    """Return the offset rounded up to the alignment.
+
+    Arguments:
+        offset {int} -- Offset
+
+    Returns:
+        int -- Aligned offset
+    """
+    return offset + -offset % ALIGNMENT
+
+
+def _header(count: int, index_offset: int) -> bytes:
+    """Return the header of an archive.
+
+    Arguments:
+        count {int} -- Number of series
+        index_offset {int} -- Offset of the index
+
+    Returns:
+        bytes -- Header
+    """
+    return HEADER.pack(
+        MAGIC,
+        VERSION,
+        BYTE_ORDERS[sys.byteorder],
+        count,
+        index_offset,
+    )
+
+
+def _write_blocks(
+    archive_file: BinaryIO,
+    dense: Dict[str, Tuple[date, array]],
+    index: Dict[str, Tuple[str, date, int, int, int]],
+) -> None:
+    """Write the data of series at the end of a file and index them.
+
+    Arguments:
+        archive_file {BinaryIO} -- Archive file, at its end
+        dense {Dict[str, Tuple[date, array]]} -- First date and values per
+            slug
+        index {Dict[str, Tuple[str, date, int, int, int]]} -- Index to add
+            the series to
+    """
+    for slug, (start, values) in dense.items():
+        offset: int = _aligned(archive_file.tell())
+        archive_file.write(b'\0' * (offset - archive_file.tell()))
+
+        values.tofile(archive_file)
+        array(
+            values.typecode,
+            [MISSING[values.typecode]] * SLACK_DAYS,
+        ).tofile(archive_file)
+
+        index[slug] = (
+            values.typecode,
+            start,
+            len(values),
+            len(values) + SLACK_DAYS,
+            offset,
+        )
+
+
+def _write_index(
+    archive_file: BinaryIO,
+    index: Dict[str, Tuple[str, date, int, int, int]],
+) -> int:
+    """Write an index at the end of a file.
+
+    Arguments:
+        archive_file {BinaryIO} -- Archive file, at its end
+        index {Dict[str, Tuple[str, date, int, int, int]]} -- Index
+
+    Returns:
+        int -- Offset of the index
+    """
+    index_offset: int = _aligned(archive_file.tell())
+    archive_file.write(b'\0' * (index_offset - archive_file.tell()))
+
+    for slug, (typecode, start, size, capacity, offset) in index.items():
+        encoded: bytes = slug.encode()
+        archive_file.write(ENTRY.pack(
+            len(encoded),
+            typecode.encode(),
+            start.toordinal(),
+            size,
+            capacity,
+            offset,
+        ))
+        archive_file.write(encoded)
+
+    return index_offset
+
+
+def _write_dense(path: str, dense: Dict[str, Tuple[date, array]]) -> None:
+    """Write dense series to a new archive.
+
+    The archive is written under a temporary name and renamed when it is
+    complete, so readers never see a partial archive.
+
+    Arguments:
+        path {str} -- Archive path
+        dense {Dict[str, Tuple[date, array]]} -- First date and values per
+            slug
+    """
+    index: Dict[str, Tuple[str, date, int, int, int]] = {}
+
+    with open(f'{path}.tmp', 'wb') as archive_file:
+        archive_file.write(b'\0' * HEADER.size)
+        _write_blocks(archive_file, dense, index)
+        index_offset: int = _write_index(archive_file, index)
+
+        archive_file.seek(0)
+        archive_file.write(_header(len(index), index_offset))
+
+    os.replace(f'{path}.tmp', path)
+
+
+def write_archive(
+    path: str,
+    series: Dict[str, dict],
+    typecode: str = 'i',
+) -> None:
+    """Write series to an archive.
+
+    Arguments:
+        path {str} -- Archive path
+        series {Dict[str, dict]} -- Series of date: value per slug
+
+    Keyword Arguments:
+        typecode {str} -- Array type code, 'i' (int32) or 'd' (float64)
+            (default: {'i'})
+    """
+    _write_dense(path, {
+        slug: _dense(values, typecode)
+        for slug, values in series.items()
+        if values
+    })
+
+
+class SeriesArchive(object):
+    """Memory-mapped archive of daily series.
+
+    Series are returned as memoryviews on the mapped file, without copying or
+    parsing. The memoryviews must be released before the archive is closed.
+    The archive is read-only, unless it is opened for writing by
+    update_archive.
+    """
+
+    def __init__(self, path: str, writable: bool = False) -> None:
+        """Open and index the archive.
+
+        Arguments:
+            path {str} -- Archive path
+
+        Keyword Arguments:
+            writable {bool} -- Map the archive for writing (default: {False})
+
+        Raises:
+            ArchiveError: When the file is not a compatible archive
+        """
+        self.path: str = path
+        self.index: Dict[str, Tuple[str, date, int, int, int]] = {}
+
+        with open(path, 'r+b' if writable else 'rb') as archive_file:
+            self.mmap: mmap.mmap = mmap.mmap(
+                archive_file.fileno(),
+                0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+            )
+
+        magic, version, byte_order, count, index_offset = HEADER.unpack_from(
+            self.mmap,
+            0,
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ArchiveError(f'{path} is not a version {VERSION} archive')
+        if byte_order != BYTE_ORDERS[sys.byteorder]:
+            raise ArchiveError(f'{path} was written with another byte order')
+
+        position: int = index_offset
+        for _ in range(count):
+            length, typecode, start, size, capacity, offset = (
+                ENTRY.unpack_from(self.mmap, position)
+            )
+            position += ENTRY.size
+            slug: str = self.mmap[position:position + length].decode()
+            position += length
+            self.index[slug] = (
+                typecode.decode(),
+                date.fromordinal(start),
+                size,
+                capacity,
+                offset,
+            )
+
+    def __enter__(self) -> 'SeriesArchive':
+        """Enter context.
+
+        Returns:
+            SeriesArchive -- The archive
+        """
+        return self
+
+    def __exit__(self, *exc_info: tuple) -> None:
+        """Exit context, close the archive.
+
+        Arguments:
+            exc_info {tuple} -- Exception info
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Close the archive."""
+        self.mmap.close()
+
+    def series(self, slug: str) -> Optional[Tuple[date, memoryview]]:
+        """Return the first date and the values of a slug, without copying.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Returns:
+            Optional[Tuple[date, memoryview]] -- First date and values
+        """
+        if slug not in self.index:
+            return None
+
+        _, start, size, _, _ = self.index[slug]
+        return start, self.block(slug)[:size]
+
+    def block(self, slug: str) -> memoryview:
+        """Return the values of a slug including the room for later days.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Returns:
+            memoryview -- Values, missing after the last day
+        """
+        typecode, _, _, capacity, offset = self.index[slug]
+        itemsize: int = array(typecode).itemsize
+
+        return memoryview(self.mmap)[
+            offset:offset + capacity * itemsize
+        ].cast(typecode)
+
+    def items(self, slug: str) -> Generator:
+        """Yield the days with data of a slug.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Yields:
+            Generator -- Tuple of ISO date and value
+        """
+        found: Optional[Tuple[date, memoryview]] = self.series(slug)
+        if found is None:
+            return
+
+        typecode: str = self.index[slug][0]
+        start, values = found
+        with values:
+            for day, input_value in enumerate(values):
+                if present(typecode, input_value):
+                    yield str(start + timedelta(day)), input_value
+
+    def total(self, slug: str, first: date, last: date) -> float:
+        """Return the sum of the values of a slug from first to last.
+
+        Arguments:
+            slug {str} -- Plugin
+            first {date} -- First date, inclusive
+            last {date} -- Last date, inclusive
+
+        Returns:
+            float -- Sum, days without data are skipped
+        """
+        found: Optional[Tuple[date, memoryview]] = self.series(slug)
+        if found is None:
+            return 0
+
+        typecode: str = self.index[slug][0]
+        start, values = found
+        with values:
+            window: memoryview = values[
+                max((first - start).days, 0):max((last - start).days + 1, 0)
+            ]
+            with window:
+                return sum(
+                    input_value for input_value in window
+                    if present(typecode, input_value)
+                )
+
+    def to_array(self, slug: str) -> Tuple[date, array]:
+        """Return a copy of the first date and the values of a slug.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Returns:
+            Tuple[date, array] -- First date and values
+        """
+        typecode: str = self.index[slug][0]
+        start, values = self.series(slug)  # type: ignore
+        copy: array = array(typecode)
+        with values:
+            copy.frombytes(values.cast('B'))
+        return start, copy
+
+    def to_dict(self, slug: str) -> dict:
+        """Return the series of a slug as date: value.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Returns:
+            dict -- Series of date: value
+        """
+        return dict(self.items(slug))
+
+    def live_bytes(self) -> int:
+        """Return the bytes of the header, the data and the index in use.
+
+        Returns:
+            int -- Bytes, the rest of the file is unused
+        """
+        return HEADER.size + sum(
+            _aligned(capacity * array(typecode).itemsize)
+            + ENTRY.size
+            + len(slug.encode())
+            for slug, (typecode, _, _, capacity, _) in self.index.items()
+        )
+
+
+def _merge_in_place(
+    archive: SeriesArchive,
+    slug: str,
+    start: date,
+    values: array,
+) -> bool:
+    """Write new values of a slug in place, when they fit in its block.
+
+    Arguments:
+        archive {SeriesArchive} -- Writable archive
+        slug {str} -- Plugin
+        start {date} -- First date of the new values
+        values {array} -- New values
+
+    Returns:
+        bool -- Whether the values were written
+    """
+    if slug not in archive.index:
+        return False
+
+    typecode, archived_start, size, capacity, offset = archive.index[slug]
+    base: int = (start - archived_start).days
+    if typecode != values.typecode or base < 0:
+        return False
+    if base + len(values) > capacity:
+        return False
+
+    with archive.block(slug) as block:
+        _merge(block, base, values)
+
+    archive.index[slug] = (
+        typecode,
+        archived_start,
+        max(size, base + len(values)),
+        capacity,
+        offset,
+    )
+    return True
+
+
+def _merge_copy(
+    archive: SeriesArchive,
+    slug: str,
+    start: date,
+    values: array,
+) -> Tuple[date, array]:
+    """Return the archived values of a slug merged with new values.
+
+    Arguments:
+        archive {SeriesArchive} -- Archive
+        slug {str} -- Plugin
+        start {date} -- First date of the new values
+        values {array} -- New values
+
+    Returns:
+        Tuple[date, array] -- First date and merged values
+    """
+    typecode: str = values.typecode
+    if slug not in archive.index or archive.index[slug][0] != typecode:
+        return start, values
+
+    archived_start, archived = archive.to_array(slug)
+    first: date = min(start, archived_start)
+    last: int = max(
+        (archived_start - first).days + len(archived),
+        (start - first).days + len(values),
+    )
+
+    merged: array = array(typecode, [MISSING[typecode]]) * last
+    position: int = (archived_start - first).days
+    merged[position:position + len(archived)] = archived
+    _merge(merged, (start - first).days, values)
+
+    return first, merged
+
+
+def update_archive(
+    path: str,
+    series: Dict[str, dict],
+    typecode: str = 'i',
+) -> None:
+    """Merge series into an archive, new values replace archived values.
+
+    New values are written in place when they fit in the block of their
+    series. The other series are appended to the file with their archived
+    values, followed by a new index, and the header is written last, so an
+    interrupted update keeps the previous index. The archive is rewritten
+    when more than half of the file is unused.
+
+    Arguments:
+        path {str} -- Archive path
+        series {Dict[str, dict]} -- Series of date: value per slug
+
+    Keyword Arguments:
+        typecode {str} -- Array type code, 'i' (int32) or 'd' (float64)
+            (default: {'i'})
+    """
+    if not os.path.exists(path):
+        write_archive(path, series, typecode)
+        return
+
+    appended: Dict[str, Tuple[date, array]] = {}
+    with SeriesArchive(path, writable=True) as archive:
+        for slug, values in series.items():
+            if not values:
+                continue
+            start, dense = _dense(values, typecode)
+            if not _merge_in_place(archive, slug, start, dense):
+                appended[slug] = _merge_copy(archive, slug, start, dense)
+        archive.mmap.flush()
+        index: Dict[str, Tuple[str, date, int, int, int]] = archive.index
+
+    with open(path, 'r+b') as archive_file:
+        archive_file.seek(0, os.SEEK_END)
+        _write_blocks(archive_file, appended, index)
+        index_offset: int = _write_index(archive_file, index)
+        archive_file.flush()
+        os.fsync(archive_file.fileno())
+
+        archive_file.seek(0)
+        archive_file.write(_header(len(index), index_offset))
+
+    with SeriesArchive(path) as archive:
+        if archive.live_bytes() * 2 >= os.path.getsize(path):
+            return
+        dense_series: Dict[str, Tuple[date, array]] = {
+            slug: archive.to_array(slug) for slug in archive.index
+        }
+
+    _write_dense(path, dense_series)
@@ -0,0 +1,182 @@
+"""In-process payload cache."""
+# -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+# Default memory cap of the cache in bytes
+DEFAULT_MAX_BYTES: int = 32 * 2 ** 20
+
+# Decoded JSON takes several times the memory of its text, a 730 day
+# downloads payload about 6.7 times. Payloads are charged their text size
+# times this factor.
+MEMORY_PER_BYTE: int = 8
+
+
+class PayloadCache(object):
+    """Least recently used cache of decoded payloads.
+
+    The cache is safe to use from multiple threads. When a key is requested
+    while it is being loaded by another thread, the request waits for that
+    load instead of loading it again. Cached payloads are shared, so they
+    must not be mutated.
+
+    A payload is only kept for the number of later reads that the caller
+    expects, and removed at the last of them.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the cache.
+
+        Keyword Arguments:
+            max_bytes {int} -- Memory cap in bytes of the decoded payloads,
+                0 disables caching (default: {DEFAULT_MAX_BYTES})
+        """
+        self.max_bytes: int = max_bytes
+        self.size: int = 0
+        self.hits: int = 0
+        self.coalesced: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.bytes_loaded: int = 0
+        self.bytes_saved: int = 0
+
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._waiting: Dict[str, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(
+        self,
+        key: str,
+        load: Callable[[], Tuple[Any, int]],
+        readers: int = 0,
+    ) -> Any:
+        """Return the payload of a key, load it when it is not cached.
+
+        Arguments:
+            key {str} -- Cache key
+            load {Callable[[], Tuple[Any, int]]} -- Returns the payload and
+                its size in bytes
+
+        Keyword Arguments:
+            readers {int} -- Number of later reads of a loaded payload, it is
+                not kept without them (default: {0})
+
+        Returns:
+            Any -- Payload
+        """
+        owner: bool = False
+
+        with self._lock:
+            # Cached, removed at its last read
+            if key in self._entries:
+                payload, size, remaining = self._entries[key]
+                if remaining > 1:
+                    self._entries[key] = (payload, size, remaining - 1)
+                    self._entries.move_to_end(key)
+                else:
+                    self._remove(key)
+                self.hits += 1
+                self.bytes_saved += size
+                return payload
+
+            # Being loaded by another thread
+            future: Future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                self._waiting[key] = self._waiting.get(key, 0) + 1
+            else:
+                future = Future()
+                self._inflight[key] = future
+                self.misses += 1
+                owner = True
+
+        # Wait for the load of the other thread
+        if not owner:
+            return future.result()
+
+        try:
+            payload, size = load()
+        except BaseException as err:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self._waiting.pop(key, None)
+            future.set_exception(err)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            self.bytes_loaded += size
+
+            # The reads that waited for the load are done
+            readers -= self._waiting.pop(key, 0)
+            if readers > 0:
+                self._store(key, payload, size, readers)
+        future.set_result(payload)
+
+        return payload
+
+    def clear(self) -> None:
+        """Remove all cached payloads, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        """Return the counters of the cache.
+
+        Returns:
+            dict -- Counters
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size': self.size,
+                'hits': self.hits,
+                'coalesced': self.coalesced,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'bytes_loaded': self.bytes_loaded,
+                'bytes_saved': self.bytes_saved,
+            }
+
+    def _store(
+        self,
+        key: str,
+        payload: Any,
+        size: int,
+        readers: int,
+    ) -> None:
+        """Store a payload and evict the least recently used payloads.
+
+        Must be called with the lock held.
+
+        Arguments:
+            key {str} -- Cache key
+            payload {Any} -- Payload
+            size {int} -- Size in bytes of the text
+            readers {int} -- Number of later reads
+        """
+        # Payloads larger than the cap are not cached
+        if size * MEMORY_PER_BYTE > self.max_bytes:
+            return
+
+        self._entries[key] = (payload, size, readers)
+        self.size += size * MEMORY_PER_BYTE
+
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Remove a payload.
+
+        Must be called with the lock held.
+
+        Arguments:
+            key {str} -- Cache key
+        """
+        _, size, _ = self._entries.pop(key)
+        self.size -= size * MEMORY_PER_BYTE
@@ -0,0 +1,190 @@
+"""State checkpointing."""
+# -*- coding: utf-8 -*-
+import base64
+import time
+import zlib
+from typing import Dict, List, Optional, Set
+
+import singer
+
+# Default seconds between checkpoints
+DEFAULT_SECONDS: float = 60
+
+# State keys that grow with the number of plugins and are not needed to
+# resume, they are left out of the checkpoints within a stream. A run that is
+# interrupted within a stream resumes without them.
+FULL_STATE_KEYS: tuple = ('scheduler',)
+
+
+def fingerprint(plugins: List[str]) -> str:
+    """Return a short fingerprint of a list of plugins.
+
+    Arguments:
+        plugins {List[str]} -- Plugins
+
+    Returns:
+        str -- Fingerprint
+    """
+    joined: str = '\n'.join(plugins)
+    return f'{zlib.crc32(joined.encode()):08x}'
+
+
+class CheckpointPolicy(object):
+    """Decides when the Singer state is written.
+
+    Bookmark updates are made in memory. The state is written after a number
+    of records, after a number of seconds, at plugin boundaries and at the
+    end of every stream, but only when it changed since it was last written.
+    Only the state at the end of a stream contains the keys in
+    FULL_STATE_KEYS.
+
+    The (stream, plugin) pairs that are done are kept in the state until the
+    sync is complete, so a resumed run skips them. They are kept as a bitmap
+    per stream over the plugins, with a fingerprint of the plugins.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        plugins: Optional[List[str]] = None,
+        every_records: int = 0,
+        every_seconds: float = DEFAULT_SECONDS,
+        plugin_boundaries: bool = False,
+    ) -> None:
+        """Initialize the policy.
+
+        Arguments:
+            state {dict} -- Singer state
+
+        Keyword Arguments:
+            plugins {Optional[List[str]]} -- Plugins of the sync, done
+                plugins are only kept for these (default: {None})
+            every_records {int} -- Records between checkpoints, 0 disables
+                (default: {0})
+            every_seconds {float} -- Seconds between checkpoints, 0 disables
+                (default: {DEFAULT_SECONDS})
+            plugin_boundaries {bool} -- Checkpoint after every plugin
+                (default: {False})
+        """
+        self.state: dict = state
+        self.plugins: List[str] = plugins or []
+        self.positions: Dict[str, int] = {
+            plugin: position for position, plugin in enumerate(self.plugins)
+        }
+        self.fingerprint: str = fingerprint(self.plugins)
+        self.every_records: int = every_records
+        self.every_seconds: float = every_seconds
+        self.plugin_boundaries: bool = plugin_boundaries
+
+        self.records: int = 0
+        self.last: float = time.monotonic()
+        self.dirty: bool = False
+        self.partial: bool = False
+        self.written: int = 0
+
+        # Bitmaps of the done plugins per stream, resumed from the state
+        self.done_plugins: Dict[str, bytearray] = {}
+        completed: dict = state.get('completed', {})
+        if completed.get('plugins') == self.fingerprint:
+            self.done_plugins = {
+                stream: bytearray(base64.b64decode(bitmap))
+                for stream, bitmap in completed.get('streams', {}).items()
+            }
+
+    def completed(self, stream: str) -> Set[str]:
+        """Return the plugins that are done for a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+
+        Returns:
+            Set[str] -- Plugins
+        """
+        bitmap: bytearray = self.done_plugins.get(stream, bytearray())
+        return {
+            plugin for plugin, position in self.positions.items()
+            if position // 8 < len(bitmap)
+            and bitmap[position // 8] >> (position % 8) & 1
+        }
+
+    def start(self, stream: str) -> None:
+        """Mark a stream as currently syncing.
+
+        Arguments:
+            stream {str} -- Stream name
+        """
+        singer.set_currently_syncing(self.state, stream)
+        self.dirty = True
+
+    def record(self) -> None:
+        """Count a written record and checkpoint when it is due."""
+        self.records += 1
+        self.dirty = True
+
+        if self.every_records and self.records >= self.every_records:
+            self.flush(full=False)
+        elif self.every_seconds and (
+            time.monotonic() - self.last >= self.every_seconds
+        ):
+            self.flush(full=False)
+
+    def done(self, stream: str, plugin: str) -> None:
+        """Mark a plugin as done for a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugin {str} -- Plugin
+        """
+        position: Optional[int] = self.positions.get(plugin)
+        if position is not None:
+            bitmap: bytearray = self.done_plugins.setdefault(
+                stream,
+                bytearray((len(self.plugins) + 7) // 8),
+            )
+            bitmap[position // 8] |= 1 << (position % 8)
+            self.dirty = True
+
+        if self.plugin_boundaries:
+            self.flush(full=False)
+
+    def flush(self, full: bool = True) -> None:
+        """Write the state if it changed.
+
+        Keyword Arguments:
+            full {bool} -- Include the keys in FULL_STATE_KEYS, a full state
+                is also written when only a partial state was written since
+                the last full state (default: {True})
+        """
+        if self.done_plugins:
+            self.state['completed'] = {
+                'plugins': self.fingerprint,
+                'streams': {
+                    stream: base64.b64encode(bitmap).decode()
+                    for stream, bitmap in self.done_plugins.items()
+                },
+            }
+
+        if full and (self.dirty or self.partial):
+            singer.write_state(self.state)
+            self.written += 1
+            self.partial = False
+        elif self.dirty:
+            singer.write_state({
+                key: state_value
+                for key, state_value in self.state.items()
+                if key not in FULL_STATE_KEYS
+            })
+            self.written += 1
+            self.partial = True
+
+        self.records = 0
+        self.last = time.monotonic()
+        self.dirty = False
+
+    def finish(self) -> None:
+        """Mark the sync as complete and write the state."""
+        self.done_plugins = {}
+        self.state.pop('completed', None)
+        singer.set_currently_syncing(self.state, None)
+        self.dirty = True
+        self.flush()
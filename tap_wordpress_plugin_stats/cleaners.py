@@ -1,9 +1,11 @@
 """Cleaner functions."""
 # -*- coding: utf-8 -*-
 
+from collections import namedtuple
 from datetime import datetime, timezone
+from functools import lru_cache
 from types import MappingProxyType
-from typing import Any, Optional
+from typing import Any, FrozenSet, Optional, Tuple
 
 from tap_wordpress_plugin_stats.streams import STREAMS
 
@@ -55,150 +57,458 @@ def to_type_or_null(
     return input_value
 
 
-def clean_row(row: dict, mapping: dict) -> dict:
-    """Clean the row according to the mapping.
+def record_type(
+    stream: str,
+    selected: Optional[FrozenSet[str]] = None,
+) -> type:
+    """Create the compact record type of a stream.
 
-    The mapping is a dictionary with optional keys:
-    - map: The name of the new key/column
-    - type: A data type or function to apply to the value of the key
-    - nullable: Whether to convert empty values, such as '', {} or [] to None
+    The record type is a namedtuple, which has no per-instance __dict__. The
+    fields are the (mapped) keys of the stream mapping in STREAMS, in order.
 
     Arguments:
-        row {dict} -- Input row
-        mapping {dict} -- Input mapping
+        stream {str} -- Stream name
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
 
     Returns:
-        dict -- Cleaned row
+        type -- Record type
     """
-    cleaned: dict = {}
+    mapping: dict = STREAMS[stream].get('mapping', {})
+
+    # Retrieve the new mapping or use the original
+    fields: list = [
+        key_mapping.get('map') or key
+        for key, key_mapping in mapping.items()
+        if is_selected(selected, key_mapping.get('map') or key)
+    ]
+    name: str = stream.title().replace('_', '')
+
+    return namedtuple(f'{name}Record', fields)
 
-    key: str
-    key_mapping: dict
 
-    # For every key and value in the mapping
-    for key, key_mapping in mapping.items():
+def is_selected(selected: Optional[FrozenSet[str]], field: str) -> bool:
+    """Return whether a field is selected.
+
+    Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+        field {str} -- Field
+
+    Returns:
+        bool -- Whether the field is selected
+    """
+    return selected is None or field in selected
 
-        # Retrieve the new mapping or use the original
-        new_mapping: str = key_mapping.get('map') or key
 
-        # Convert the value
-        cleaned[new_mapping] = to_type_or_null(
-            row[key],
-            key_mapping.get('type'),
-            key_mapping.get('null', True),
+# Compact record type per stream
+RECORDS: MappingProxyType = MappingProxyType({
+    stream: record_type(stream) for stream in STREAMS
+})
+
+# Key, data type and nullable of every field per stream, in record order
+CONVERSIONS: MappingProxyType = MappingProxyType({
+    stream: tuple(
+        (key, key_mapping.get('type'), key_mapping.get('null', True))
+        for key, key_mapping in stream_meta.get('mapping', {}).items()
+    )
+    for stream, stream_meta in STREAMS.items()
+})
+
+
+@lru_cache(maxsize=None)
+def projection(
+    stream: str,
+    selected: Optional[FrozenSet[str]] = None,
+) -> Tuple[type, tuple]:
+    """Return the record type and conversions of the selected fields.
+
+    Arguments:
+        stream {str} -- Stream name
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        Tuple[type, tuple] -- Record type and conversions
+    """
+    if selected is None:
+        return RECORDS[stream], CONVERSIONS[stream]
+
+    return record_type(stream, selected), tuple(
+        conversion
+        for field, conversion in zip(
+            RECORDS[stream]._fields,
+            CONVERSIONS[stream],
         )
+        if field in selected
+    )
 
-    return cleaned
 
+def clean_row(
+    row: dict,
+    stream: str,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean the row according to the mapping of the stream.
 
-def clean_active_versions(row: dict) -> dict:
-    """Clean active versions.
+    The mapping is a dictionary with optional keys:
+    - map: The name of the new key/column
+    - type: A data type or function to apply to the value of the key
+    - nullable: Whether to convert empty values, such as '', {} or [] to None
+
+    The cleaned row is a compact record (see RECORDS), it is only converted to
+    a dictionary when it is written, using record._asdict(). Only the selected
+    fields are read from the row and converted.
 
     Arguments:
         row {dict} -- Input row
+        stream {str} -- Stream name
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
 
     Returns:
-        dict -- Cleaned row
+        tuple -- Cleaned record
     """
-    mapping: dict = STREAMS['active_versions'].get('mapping', {})
+    record, conversions = projection(stream, selected)
+
+    # Convert the value of every selected key in the mapping
+    return record(*[
+        to_type_or_null(row[key], data_type, nullable)
+        for key, data_type, nullable in conversions
+    ])
+
+
+# Keys of the info stream that are copied from the plugin data
+INFO_KEYS: tuple = (
+    'active_installs',
+    'downloaded',
+    'last_updated',
+    'num_ratings',
+    'rating',
+    'support_threads',
+    'support_threads_resolved',
+    'version',
+)
+
+# Stars of the info stream ratings
+INFO_RATINGS: tuple = ('0', '1', '2', '3', '4', '5')
+
+
+def clean_active_versions(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean active versions.
+
+    Arguments:
+        row {dict} -- Input row
 
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
     # Add timestamp
-    row['timestamp'] = datetime.now(
-        tz=timezone.utc,
-    ).replace(microsecond=0).isoformat()
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
 
     # Fix too long floats
-    row['percentage'] = str(round(float(row['percentage']), 4))
+    if is_selected(selected, 'percentage'):
+        row['percentage'] = str(round(float(row['percentage']), 4))
 
-    return clean_row(row, mapping)
+    return clean_row(row, 'active_versions', selected)
 
 
-def clean_active_installs(row: dict) -> dict:
+def clean_active_installs(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
     """Clean active installs.
 
     Arguments:
         row {dict} -- Input row
 
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
     Returns:
-        dict -- Cleaned row
+        tuple -- Cleaned record
     """
-    mapping: dict = STREAMS['active_installs'].get('mapping', {})
+    if is_selected(selected, 'percentage'):
+        row['percentage'] = row['percentage'].rstrip('-').rstrip('+')
 
-    row['percentage'] = row['percentage'].rstrip('-').rstrip('+')
+    return clean_row(row, 'active_installs', selected)
 
-    return clean_row(row, mapping)
 
-
-def clean_downloads(row: dict) -> dict:
+def clean_downloads(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
     """Clean downloads.
 
     Arguments:
         row {dict} -- Input row
 
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
     Returns:
-        dict -- Cleaned row
+        tuple -- Cleaned record
     """
-    mapping: dict = STREAMS['downloads'].get('mapping', {})
-
-    return clean_row(row, mapping)
+    return clean_row(row, 'downloads', selected)
 
 
-def clean_downloads_summary(row: dict) -> dict:
+def clean_downloads_summary(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
     """Clean download summary.
 
     Arguments:
         row {dict} -- Input row
 
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
     Returns:
-        dict -- Cleaned row
+        tuple -- Cleaned record
     """
-    mapping: dict = STREAMS['downloads_summary'].get('mapping', {})
-
     # Add timestamp
-    row['timestamp'] = datetime.now(
-        tz=timezone.utc,
-    ).replace(microsecond=0).isoformat()
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
 
-    return clean_row(row, mapping)
+    return clean_row(row, 'downloads_summary', selected)
 
 
-def clean_info(row: dict) -> dict:
+def clean_info(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
     """Clean info.
 
     Arguments:
         row {dict} -- Input row
 
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
     Returns:
-        dict -- Cleaned row
+        tuple -- Cleaned record
     """
-    mapping: dict = STREAMS['info'].get('mapping', {})
-
     # Add timestamp
-    row['timestamp'] = datetime.now(
-        tz=timezone.utc,
-    ).replace(microsecond=0).isoformat()
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
 
     plugin_data: dict = row['plugins'][0]
+    ratings: dict = plugin_data.get('ratings', {})
 
-    # Add data
-    row['active_installs'] = plugin_data.get('active_installs')
-    row['downloaded'] = plugin_data.get('downloaded')
-    row['last_updated'] = plugin_data.get('last_updated')
-    row['num_ratings'] = plugin_data.get('num_ratings')
-    row['rating'] = plugin_data.get('rating')
-    row['ratings_0'] = plugin_data.get('ratings', {}).get('0')
-    row['ratings_1'] = plugin_data.get('ratings', {}).get('1')
-    row['ratings_2'] = plugin_data.get('ratings', {}).get('2')
-    row['ratings_3'] = plugin_data.get('ratings', {}).get('3')
-    row['ratings_4'] = plugin_data.get('ratings', {}).get('4')
-    row['ratings_5'] = plugin_data.get('ratings', {}).get('5')
-    row['support_threads'] = plugin_data.get('support_threads')
-    row['support_threads_resolved'] = plugin_data.get(
-        'support_threads_resolved',
-    )
-    row['version'] = plugin_data.get('version')
+    # Add the selected data
+    for key in INFO_KEYS:
+        if is_selected(selected, key):
+            row[key] = plugin_data.get(key)
+    for stars in INFO_RATINGS:
+        if is_selected(selected, f'ratings_{stars}'):
+            row[f'ratings_{stars}'] = ratings.get(stars)
+
+    return clean_row(row, 'info', selected)
+
+
+def clean_plugin_information(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean plugin information.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    # Add timestamp
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
+
+    # Add data that is missing for some plugins
+    row['requires'] = row.get('requires')
+    row['tested'] = row.get('tested')
+    row['requires_php'] = row.get('requires_php')
+    row['added'] = row.get('added')
+    row['homepage'] = row.get('homepage')
+    row['support_threads'] = row.get('support_threads')
+    row['support_threads_resolved'] = row.get('support_threads_resolved')
+    row['sections'] = row.get('sections')
+
+    return clean_row(row, 'plugin_information', selected)
+
+
+def clean_plugin_versions(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean plugin versions.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    # Add timestamp
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
+
+    return clean_row(row, 'plugin_versions', selected)
+
+
+def clean_wordpress_versions(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean WordPress versions.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    # Add timestamp
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
+
+    # Fix too long floats
+    if is_selected(selected, 'percentage'):
+        row['percentage'] = str(round(float(row['percentage']), 4))
+
+    return clean_row(row, 'wordpress_versions', selected)
+
+
+def clean_php_versions(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean PHP versions.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    # Add timestamp
+    if is_selected(selected, 'timestamp'):
+        row['timestamp'] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
+
+    # Fix too long floats
+    if is_selected(selected, 'percentage'):
+        row['percentage'] = str(round(float(row['percentage']), 4))
+
+    return clean_row(row, 'php_versions', selected)
+
+
+def clean_downloads_weekly(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean weekly downloads.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    return clean_row(row, 'downloads_weekly', selected)
+
+
+def clean_downloads_monthly(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean monthly downloads.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    return clean_row(row, 'downloads_monthly', selected)
+
+
+def clean_active_installs_delta(
+    row: dict,
+    selected: Optional[FrozenSet[str]] = None,
+) -> tuple:
+    """Clean active installs delta.
+
+    Arguments:
+        row {dict} -- Input row
+
+    Keyword Arguments:
+        selected {Optional[FrozenSet[str]]} -- Selected fields, None for all
+            fields (default: {None})
+
+    Returns:
+        tuple -- Cleaned record
+    """
+    # Fix too long floats
+    if is_selected(selected, 'percentage'):
+        row['percentage'] = str(round(row['percentage'], 4))
+    if is_selected(selected, 'delta') and row['delta'] is not None:
+        row['delta'] = str(round(row['delta'], 4))
 
-    return clean_row(row, mapping)
+    return clean_row(row, 'active_installs_delta', selected)
 
 
 CLEANERS: MappingProxyType = MappingProxyType({
@@ -207,4 +517,11 @@ CLEANERS: MappingProxyType = MappingProxyType({
     'downloads': clean_downloads,
     'downloads_summary': clean_downloads_summary,
     'info': clean_info,
+    'plugin_information': clean_plugin_information,
+    'plugin_versions': clean_plugin_versions,
+    'wordpress_versions': clean_wordpress_versions,
+    'php_versions': clean_php_versions,
+    'downloads_weekly': clean_downloads_weekly,
+    'downloads_monthly': clean_downloads_monthly,
+    'active_installs_delta': clean_active_installs_delta,
 })
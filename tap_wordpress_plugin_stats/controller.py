@@ -0,0 +1,187 @@
+"""Run limits."""
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import singer
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+
+def describe(stream: str, plugins: List[str]) -> str:
+    """Describe the deferred work of a stream.
+
+    Arguments:
+        stream {str} -- Stream name
+        plugins {List[str]} -- Deferred plugins, empty for a stream that is
+            not about plugins
+
+    Returns:
+        str -- Description
+    """
+    if plugins:
+        return f'{stream} ({len(plugins)} plugins)'
+    return stream
+
+
+class RunController(object):
+    """Stops admitting work when a limit of the run is near.
+
+    Every request of the run is counted, with its size and duration. A limit
+    is near when one more round of requests could exceed it: the number of
+    parallel requests for the request limit, and the average size and
+    duration of a request for the byte and runtime limits.
+
+    Work that is not admitted is deferred. The deferred plugins per stream are
+    logged and kept in the Singer state under "deferred", where the scheduler
+    of the next run puts them first.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        max_requests: Optional[int] = None,
+        max_runtime: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        parallel: int = 1,
+    ) -> None:
+        """Initialize the controller, the runtime starts now.
+
+        Arguments:
+            state {dict} -- Singer state
+
+        Keyword Arguments:
+            max_requests {Optional[int]} -- Maximum number of requests
+                (default: {None})
+            max_runtime {Optional[float]} -- Maximum seconds
+                (default: {None})
+            max_bytes {Optional[int]} -- Maximum bytes of the responses
+                (default: {None})
+            parallel {int} -- Number of parallel requests (default: {1})
+        """
+        self.state: dict = state
+        self.max_requests: Optional[int] = max_requests
+        self.max_runtime: Optional[float] = max_runtime
+        self.max_bytes: Optional[int] = max_bytes
+        self.parallel: int = max(parallel, 1)
+
+        self.started: float = time.monotonic()
+        self.requests: int = 0
+        self.bytes: int = 0
+        self.request_seconds: float = 0
+        self.deferred: Dict[str, List[str]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, size: int, seconds: float) -> None:
+        """Count a request.
+
+        Arguments:
+            size {int} -- Size of the response in bytes
+            seconds {float} -- Duration of the request
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            self.request_seconds += seconds
+
+    def limit(self) -> Optional[str]:
+        """Return the limit that is near.
+
+        Returns:
+            Optional[str] -- Name of the limit, None if no limit is near
+        """
+        with self._lock:
+            requests: int = self.requests
+            size: int = self.bytes
+            average_size: float = size / max(requests, 1)
+            average_seconds: float = self.request_seconds / max(requests, 1)
+
+        if self.max_requests is not None and (
+            requests + self.parallel > self.max_requests
+        ):
+            return 'max_requests'
+        if self.max_bytes is not None and (
+            size + self.parallel * average_size > self.max_bytes
+        ):
+            return 'max_bytes'
+        if self.max_runtime is not None and (
+            self.elapsed() + average_seconds > self.max_runtime
+        ):
+            return 'max_runtime_seconds'
+        return None
+
+    def elapsed(self) -> float:
+        """Return the seconds since the start of the run.
+
+        Returns:
+            float -- Seconds
+        """
+        return time.monotonic() - self.started
+
+    def admit(self, stream: str, plugins: Iterable[str]) -> Iterator[str]:
+        """Yield the plugins of a stream until a limit is near.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugins {Iterable[str]} -- Plugins
+
+        Yields:
+            Iterator[str] -- Admitted plugins
+        """
+        remaining: Iterator[str] = iter(plugins)
+
+        for plugin in remaining:
+            reason: Optional[str] = self.limit()
+            if reason:
+                self._defer(stream, [plugin, *remaining], reason)
+                return
+            yield plugin
+
+    def admitted(self, stream: str) -> bool:
+        """Return whether a stream that is not about plugins is admitted.
+
+        Arguments:
+            stream {str} -- Stream name
+
+        Returns:
+            bool -- Whether the stream is admitted
+        """
+        reason: Optional[str] = self.limit()
+        if reason:
+            self._defer(stream, [], reason)
+            return False
+        return True
+
+    def finish(self) -> None:
+        """Log the usage of the run and keep the deferred work in the state."""
+        LOGGER.info(
+            f'Run usage: {self.requests} requests, {self.bytes} bytes, '
+            f'{self.elapsed():.1f}s',
+        )
+
+        if self.deferred:
+            self.state['deferred'] = self.deferred
+            LOGGER.warning(
+                'Deferred to the next run: ' + ', '.join(
+                    describe(stream, plugins)
+                    for stream, plugins in self.deferred.items()
+                ),
+            )
+        else:
+            self.state.pop('deferred', None)
+
+    def _defer(self, stream: str, plugins: List[str], reason: str) -> None:
+        """Defer the plugins of a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugins {List[str]} -- Plugins
+            reason {str} -- Name of the limit
+        """
+        self.deferred[stream] = plugins
+        LOGGER.warning(
+            f'Limit {reason} is near, deferring stream '
+            f'{describe(stream, plugins)} to the next run',
+        )
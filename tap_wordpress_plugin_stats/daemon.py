@@ -0,0 +1,204 @@
+"""Run the tap as a long-running daemon."""
+# -*- coding: utf-8 -*-
+import logging
+import os
+import socket
+import time
+from argparse import Namespace
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+from singer import get_logger, utils
+from singer.catalog import Catalog
+
+from tap_wordpress_plugin_stats.discover import discover
+from tap_wordpress_plugin_stats.scheduler import PluginScheduler
+from tap_wordpress_plugin_stats.sync import sync
+from tap_wordpress_plugin_stats.tap import (  # noqa: I001
+    REQUIRED_CONFIG_KEYS,  # noqa: I001
+    create_client,  # noqa: I001
+    create_controller,  # noqa: I001
+)  # noqa: I001
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+LOGGER: logging.RootLogger = get_logger()
+
+HOUR: int = 3600
+
+# Default seconds between the runs of every stream
+DEFAULT_INTERVALS: MappingProxyType = MappingProxyType({
+    'active_versions': 4 * HOUR,
+    'active_installs': 24 * HOUR,
+    'downloads': 24 * HOUR,
+    'downloads_summary': HOUR,
+    'info': HOUR,
+    'plugin_information': 24 * HOUR,
+    'plugin_versions': 24 * HOUR,
+    'wordpress_versions': 24 * HOUR,
+    'php_versions': 24 * HOUR,
+    'downloads_weekly': 24 * HOUR,
+    'downloads_monthly': 24 * HOUR,
+    'active_installs_delta': 24 * HOUR,
+})
+
+
+def new_output(stem: str) -> Tuple[str, TextIO]:
+    """Create the temporary file of a new output file.
+
+    The output is named after the stem, with a sequence number when an
+    output or temporary file with that name exists.
+
+    Arguments:
+        stem {str} -- Path of the output without extension
+
+    Returns:
+        Tuple[str, TextIO] -- Output path and its opened temporary file
+    """
+    sequence: int = 0
+    while True:  # noqa: WPS457
+        path: str = f'{stem}-{sequence}.jsonl' if sequence else f'{stem}.jsonl'
+        sequence += 1
+        if os.path.exists(path):
+            continue
+        try:
+            return path, open(f'{path}.tmp', 'x')  # noqa: WPS515
+        except FileExistsError:
+            continue
+
+
+@contextmanager
+def tick_output(config: dict, started: datetime) -> Iterator[TextIO]:
+    """Open the output of a tick.
+
+    The output is a connection to the Unix socket "daemon_socket" if it is
+    set. Otherwise it is a new file in "daemon_output_dir", named after the
+    start of the tick. The file is written under a temporary name and linked
+    to its name when the tick is complete, an existing output is never
+    replaced. The temporary file of a failed tick is renamed to .failed.
+
+    Arguments:
+        config {dict} -- Tap config
+        started {datetime} -- Start of the tick
+
+    Yields:
+        Iterator[TextIO] -- Output
+    """
+    if config.get('daemon_socket'):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(config['daemon_socket'])
+            with connection.makefile('w') as socket_output:
+                yield socket_output
+        return
+
+    output_dir: str = config.get('daemon_output_dir', '.')
+    path, file_output = new_output(
+        os.path.join(output_dir, f'{started:%Y%m%dT%H%M%S.%f}'),
+    )
+
+    complete: bool = False
+    try:
+        with file_output:
+            yield file_output
+        # A link fails instead of replacing an existing file
+        os.link(f'{path}.tmp', path)
+        complete = True
+    finally:
+        if complete:
+            os.remove(f'{path}.tmp')
+        else:
+            os.replace(f'{path}.tmp', f'{path}.failed')
+
+
+def tick(
+    wp: WordPressPluginStats,
+    catalog: Catalog,
+    streams: List[str],
+    config: dict,
+) -> None:
+    """Sync the due streams with the warm client.
+
+    Arguments:
+        wp {WordPressPluginStats} -- WordPressPluginStats client
+        catalog {Catalog} -- Stream catalog
+        streams {List[str]} -- Due streams
+        config {dict} -- Tap config
+    """
+    started: datetime = datetime.now(tz=timezone.utc)
+    start: float = time.perf_counter()
+
+    # Payloads are only cached during a tick, the connections are kept, the
+    # limits apply per tick
+    wp.cache.clear()
+    wp.scheduler = PluginScheduler(
+        wp.state,
+        weights=config.get('plugin_weights'),
+    )
+    wp.controller = create_controller(config, wp)
+
+    due: Catalog = Catalog([
+        entry for entry in catalog.streams if entry.tap_stream_id in streams
+    ])
+
+    with tick_output(config, started) as output:
+        with redirect_stdout(output):
+            counts: Dict[str, int] = sync(
+                wp,
+                due,
+                validate_every=config.get('validate_records', 0),
+            )
+
+    duration: float = time.perf_counter() - start
+    records: int = sum(counts.values())
+    LOGGER.info(
+        f'Tick {", ".join(streams)}: {records} records in {duration:.1f}s '
+        f'({records / max(duration, 1e-6):.0f} records/s), {counts}',
+    )
+
+
+@utils.handle_top_exception(LOGGER)
+def main() -> None:  # noqa: WPS210
+    """Run tap as a daemon."""
+    args: Namespace = utils.parse_args(REQUIRED_CONFIG_KEYS)
+
+    catalog: Catalog = args.catalog or discover()
+    wp: WordPressPluginStats = create_client(args.config, args.state)
+
+    intervals: dict = {
+        **DEFAULT_INTERVALS,
+        **args.config.get('stream_intervals', {}),
+    }
+    next_runs: Dict[str, float] = {
+        stream.tap_stream_id: 0
+        for stream in catalog.get_selected_streams({})
+        if stream.tap_stream_id in intervals
+    }
+
+    LOGGER.info(f'Running daemon for streams: {", ".join(next_runs)}')
+
+    while next_runs:
+        now: float = time.monotonic()
+        streams: List[str] = [
+            stream for stream, next_run in next_runs.items() if next_run <= now
+        ]
+
+        # Wait for the next due stream
+        if not streams:
+            time.sleep(min(next_runs.values()) - now)
+            continue
+
+        for stream in streams:
+            next_runs[stream] = now + intervals[stream]
+
+        # A failed tick is retried at the next interval
+        try:
+            tick(wp, catalog, streams, args.config)
+        except Exception:
+            LOGGER.exception(f'Tick {", ".join(streams)} failed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Content encodings and decoding of the API responses."""
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import threading
+import time
+import zlib
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Brotli and Zstandard are optional, they are only accepted when installed
+try:
+    import brotli  # noqa: WPS433
+except ImportError:
+    try:
+        import brotlicffi as brotli  # noqa: WPS433, WPS440
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard  # noqa: WPS433
+except ImportError:
+    zstandard = None
+
+
+class DecodingError(ValueError):
+    """Response body can not be decoded."""
+
+
+def inflate(body: bytes) -> bytes:
+    """Decompress a deflate body, with or without the zlib wrapper.
+
+    Arguments:
+        body {bytes} -- Compressed body
+
+    Returns:
+        bytes -- Decompressed body
+    """
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        return zlib.decompress(body, -zlib.MAX_WBITS)
+
+
+def unzstd(body: bytes) -> bytes:
+    """Decompress a Zstandard body.
+
+    A decompression object is used because streamed responses do not have
+    the content size in the frame header.
+
+    Arguments:
+        body {bytes} -- Compressed body
+
+    Returns:
+        bytes -- Decompressed body
+    """
+    return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+
+
+def available_decoders() -> Dict[str, Callable[[bytes], bytes]]:
+    """Return the decoders of the supported content encodings.
+
+    Returns:
+        Dict[str, Callable[[bytes], bytes]] -- Decoder per content encoding,
+            in order of preference
+    """
+    decoders: Dict[str, Callable[[bytes], bytes]] = {}
+    if brotli is not None:
+        decoders['br'] = brotli.decompress
+    if zstandard is not None:
+        decoders['zstd'] = unzstd
+    decoders['gzip'] = gzip.decompress
+    decoders['deflate'] = inflate
+    return decoders
+
+
+DECODERS: MappingProxyType = MappingProxyType(available_decoders())
+
+# Accept-Encoding header of the requests
+ACCEPT_ENCODING: str = ', '.join(DECODERS)
+
+
+def decode(body: bytes, content_encoding: str) -> bytes:
+    """Decode a response body.
+
+    Arguments:
+        body {bytes} -- Body as received
+        content_encoding {str} -- Content-Encoding header
+
+    Raises:
+        DecodingError: When an encoding is not supported or the body is
+            corrupt
+
+    Returns:
+        bytes -- Decoded body
+    """
+    encodings: List[str] = [
+        encoding.strip().lower()
+        for encoding in content_encoding.split(',')
+        if encoding.strip().lower() not in {'', 'identity'}
+    ]
+
+    # The encodings are listed in the order they were applied
+    for encoding in reversed(encodings):
+        decoder: Optional[Callable[[bytes], bytes]] = DECODERS.get(encoding)
+        if decoder is None:
+            raise DecodingError(f'Unsupported content encoding: {encoding}')
+        try:
+            body = decoder(body)
+        except Exception as err:
+            raise DecodingError(
+                f'Invalid {encoding} response body: {err}',
+            ) from err
+
+    return body
+
+
+class TransferStats(object):
+    """Counters of the bytes on the wire and the decoded bytes.
+
+    The counters are safe to update from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.responses: int = 0
+        self.wire_bytes: int = 0
+        self.decoded_bytes: int = 0
+        self.decode_seconds: float = 0
+        self.encodings: Dict[str, int] = {}
+
+        self._lock: threading.Lock = threading.Lock()
+
+    def parse(self, body: bytes, content_encoding: str) -> Tuple[dict, int]:
+        """Decode and parse a JSON response body, and count it.
+
+        Arguments:
+            body {bytes} -- Body as received
+            content_encoding {str} -- Content-Encoding header
+
+        Returns:
+            Tuple[dict, int] -- JSON as dict and the decoded size
+        """
+        start: float = time.perf_counter()
+        decoded: bytes = decode(body, content_encoding)
+        payload: dict = json.loads(decoded)
+        seconds: float = time.perf_counter() - start
+
+        encoding: str = content_encoding or 'identity'
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += len(body)
+            self.decoded_bytes += len(decoded)
+            self.decode_seconds += seconds
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+        return payload, len(decoded)
+
+    def stats(self) -> dict:
+        """Return the counters.
+
+        Returns:
+            dict -- Counters and the compression ratio
+        """
+        with self._lock:
+            return {
+                'responses': self.responses,
+                'wire_bytes': self.wire_bytes,
+                'decoded_bytes': self.decoded_bytes,
+                'ratio': round(
+                    self.decoded_bytes / max(self.wire_bytes, 1),
+                    2,
+                ),
+                'decode_seconds': round(self.decode_seconds, 3),
+                'encodings': dict(self.encodings),
+            }
@@ -3,6 +3,7 @@
 from singer import metadata
 from singer.catalog import Catalog, CatalogEntry
 from tap_wordpress_plugin_stats.schema import load_schemas
+from tap_wordpress_plugin_stats.selection import automatic_fields
 
 
 def discover() -> Catalog:  # noqa: WPS210
@@ -32,6 +33,17 @@ def discover() -> Catalog:  # noqa: WPS210
             ),
         )
 
+        # Fields that identify a record can not be deselected
+        mdata_map: dict = metadata.to_map(mdata)
+        for field in automatic_fields(stream_id):
+            mdata_map = metadata.write(
+                mdata_map,
+                ('properties', field),
+                'inclusion',
+                'automatic',
+            )
+        mdata = metadata.to_list(mdata_map)
+
         # Create a catalog entry
         streams.append(
             CatalogEntry(
@@ -0,0 +1,144 @@
+"""Downloads series verification."""
+# -*- coding: utf-8 -*-
+from datetime import date, timedelta
+from typing import List, Optional
+
+# Number of days before the bookmark that are fetched and verified again
+DEFAULT_OVERLAP: int = 7
+
+
+def window(
+    bookmark: Optional[dict],
+    limit: int,
+    today: date,
+    overlap: int = DEFAULT_OVERLAP,
+) -> int:
+    """Return the number of days to fetch.
+
+    Without a bookmark the full history (limit) is fetched. With a bookmark,
+    only the days since the bookmark and the overlap before it are fetched.
+
+    Arguments:
+        bookmark {Optional[dict]} -- Bookmark of the plugin
+        limit {int} -- Maximum number of days
+        today {date} -- Current date
+
+    Keyword Arguments:
+        overlap {int} -- Days before the bookmark (default: {DEFAULT_OVERLAP})
+
+    Returns:
+        int -- Number of days
+    """
+    if not bookmark:
+        return limit
+
+    start: date = date.fromisoformat(bookmark['date']) - timedelta(overlap)
+    return max(min((today - start).days + 1, limit), 1)
+
+
+def missing_dates(series: dict, start: date, end: date) -> List[date]:
+    """Return the dates between start and end that are not in the series.
+
+    Arguments:
+        series {dict} -- Series of date: value
+        start {date} -- First expected date
+        end {date} -- Last expected date
+
+    Returns:
+        List[date] -- Missing dates
+    """
+    return [
+        start + timedelta(day)
+        for day in range((end - start).days + 1)
+        if str(start + timedelta(day)) not in series
+    ]
+
+
+def revised_dates(series: dict, tail: dict) -> List[date]:
+    """Return the dates of which the value differs from the previous run.
+
+    Arguments:
+        series {dict} -- Series of date: value
+        tail {dict} -- Series of date: value emitted by the previous run
+
+    Returns:
+        List[date] -- Revised dates
+    """
+    return [
+        date.fromisoformat(day)
+        for day, value in tail.items()
+        if day in series and int(series[day]) != int(value)
+    ]
+
+
+def repair_window(
+    series: dict,
+    bookmark: Optional[dict],
+    today: date,
+    overlap: int = DEFAULT_OVERLAP,
+) -> int:
+    """Return the number of days to fetch again to repair the series.
+
+    Holes are only expected from the bookmark minus the overlap, or the first
+    fetched date if it is later, to the last date in the series. A hole is
+    repaired by fetching from the oldest missing date, at most once a day per
+    plugin. Without a bookmark the series is not verified, the API may not
+    have a value for every day of the history. Revised values are already in
+    the series, so they are not fetched again.
+
+    Arguments:
+        series {dict} -- Series of date: value
+        bookmark {Optional[dict]} -- Bookmark of the plugin
+        today {date} -- Current date
+
+    Keyword Arguments:
+        overlap {int} -- Days before the bookmark (default: {DEFAULT_OVERLAP})
+
+    Returns:
+        int -- Number of days, 0 if the series is complete
+    """
+    if not series or not bookmark or bookmark.get('repaired') == str(today):
+        return 0
+
+    dates: List[date] = [date.fromisoformat(day) for day in series]
+    start: date = max(
+        date.fromisoformat(bookmark['date']) - timedelta(overlap),
+        min(dates),
+    )
+
+    missing: List[date] = missing_dates(series, start, max(dates))
+    if not missing:
+        return 0
+
+    return (today - missing[0]).days + 1
+
+
+def downloads_bookmark(
+    series: dict,
+    overlap: int = DEFAULT_OVERLAP,
+    repaired: Optional[str] = None,
+) -> dict:
+    """Create the bookmark of a series.
+
+    The bookmark contains the last date and the values of the last days, to
+    detect revised values in the next run, and the date of the last repair.
+
+    Arguments:
+        series {dict} -- Series of date: value
+
+    Keyword Arguments:
+        overlap {int} -- Days to keep (default: {DEFAULT_OVERLAP})
+        repaired {Optional[str]} -- Date of the last repair
+            (default: {None})
+
+    Returns:
+        dict -- Bookmark
+    """
+    days: List[str] = sorted(series)[-overlap:]
+    bookmark: dict = {
+        'date': days[-1],
+        'tail': {day: int(series[day]) for day in days},
+    }
+    if repaired:
+        bookmark['repaired'] = repaired
+    return bookmark
@@ -0,0 +1,197 @@
+"""Run the tap for many configs in one process."""
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+from argparse import ArgumentParser, Namespace
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+from singer import get_logger, utils
+from singer.catalog import Catalog
+from singer.messages import RecordMessage, SchemaMessage, format_message
+
+from tap_wordpress_plugin_stats.discover import discover
+from tap_wordpress_plugin_stats.selection import selected_schema, selection
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+LOGGER: logging.RootLogger = get_logger()
+
+
+def parse_args() -> Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        Namespace -- Arguments
+    """
+    parser: ArgumentParser = ArgumentParser(
+        description='Run tap-wordpress-plugin-stats for many configs.',
+    )
+    parser.add_argument(
+        'configs',
+        nargs='+',
+        help='Config files, one per tenant',
+    )
+    parser.add_argument('-p', '--catalog', help='Catalog file')
+    parser.add_argument(
+        '-o',
+        '--output-dir',
+        default='.',
+        help='Directory for the output of tenants without "output" setting',
+    )
+    parser.add_argument(
+        '-n',
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Number of parallel requests of the shared client',
+    )
+    return parser.parse_args()
+
+
+def tenant_output(config_path: str, config: dict, output_dir: str) -> str:
+    """Return the output path of a tenant.
+
+    The output path is the "output" key in the config, which can also be a
+    named pipe, or <output_dir>/<config name>.jsonl.
+
+    Arguments:
+        config_path {str} -- Path of the config file
+        config {dict} -- Config
+        output_dir {str} -- Default output directory
+
+    Returns:
+        str -- Output path
+    """
+    if config.get('output'):
+        return config['output']
+
+    name: str = os.path.splitext(os.path.basename(config_path))[0]
+    return os.path.join(output_dir, f'{name}.jsonl')
+
+
+def run(  # noqa: WPS210
+    wp: WordPressPluginStats,
+    catalog: Catalog,
+    routes: Dict[str, List[TextIO]],
+    outputs: List[TextIO],
+) -> None:
+    """Sync all tenants with one shared client.
+
+    Every plugin is fetched once, its records are written to the output of
+    every tenant that tracks the plugin.
+
+    Arguments:
+        wp {WordPressPluginStats} -- Shared WordPressPluginStats client
+        catalog {Catalog} -- Stream catalog
+        routes {Dict[str, List[TextIO]]} -- Outputs per plugin
+        outputs {List[TextIO]} -- All outputs
+    """
+    # Deselected fields are neither requested nor cleaned
+    wp.selection = selection(catalog)
+
+    for stream in catalog.get_selected_streams({}):
+        LOGGER.info(f'Syncing stream: {stream.tap_stream_id}')
+
+        # Write the schema of the selected fields to every tenant
+        schema: str = format_message(
+            SchemaMessage(
+                stream=stream.tap_stream_id,
+                schema=selected_schema(
+                    stream,
+                    wp.selection[stream.tap_stream_id],
+                ),
+                key_properties=stream.key_properties,
+            ),
+        )
+        for output in outputs:
+            output.write(f'{schema}\n')
+
+        tap_data: Callable = getattr(wp, stream.tap_stream_id)
+
+        # Route every record to the tenants of its plugin, records that are
+        # not about a plugin are written to every tenant
+        for row in tap_data():
+            record: str = format_message(
+                RecordMessage(
+                    stream=stream.tap_stream_id,
+                    record=row._asdict(),
+                    time_extracted=datetime.now(timezone.utc),
+                ),
+            )
+            plugin_outputs: List[TextIO] = outputs
+            if 'plugin' in row._fields:
+                plugin_outputs = routes[row.plugin]
+            for output in plugin_outputs:
+                output.write(f'{record}\n')
+
+    LOGGER.info(f'Payload cache: {wp.cache.stats()}')
+    LOGGER.info(f'Transfer: {wp.transfer.stats()}')
+
+
+@utils.handle_top_exception(LOGGER)
+def main() -> None:  # noqa: WPS210
+    """Run tap for many configs."""
+    args: Namespace = parse_args()
+
+    # Load the catalog once for all tenants
+    if args.catalog:
+        catalog: Catalog = Catalog.load(args.catalog)
+    else:
+        catalog = discover()
+
+    # Tenants by output path, no output is opened before all are known
+    tenants: Dict[str, Tuple[str, dict]] = {}
+    for config_path in args.configs:
+        with open(config_path) as config_file:
+            config: dict = json.load(config_file)
+
+        path: str = tenant_output(config_path, config, args.output_dir)
+        duplicate: Optional[Tuple[str, dict]] = tenants.get(
+            os.path.realpath(path),
+        )
+        if duplicate:
+            raise ValueError(
+                f'Tenants {duplicate[0]} and {config_path} both write to '
+                f'{path}, set a different "output" in their configs',
+            )
+        tenants[os.path.realpath(path)] = (config_path, config)
+
+    with ExitStack() as stack:
+        routes: Dict[str, List[TextIO]] = {}
+        outputs: List[TextIO] = []
+
+        for path, (config_path, config) in tenants.items():
+            LOGGER.info(f'Tenant {config_path} writes to {path}')
+            output: TextIO = stack.enter_context(open(path, 'w'))
+            outputs.append(output)
+
+            plugins: List[str] = config['plugins']
+            if isinstance(plugins, str):
+                plugins = [plugins]
+
+            # A plugin tracked by many tenants is routed to all of them
+            for plugin in plugins:
+                plugin_routes: List[TextIO] = routes.setdefault(plugin, [])
+                if output not in plugin_routes:
+                    plugin_routes.append(output)
+
+        LOGGER.info(
+            f'Fetching {len(routes)} unique plugins for '
+            f'{len(outputs)} tenants',
+        )
+
+        # One shared client fetches every unique plugin once
+        wp: WordPressPluginStats = WordPressPluginStats(
+            list(routes),
+            concurrency=args.concurrency,
+        )
+
+        run(wp, catalog, routes, outputs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,252 @@
+"""Opt-in profiling of the sync."""
+# -*- coding: utf-8 -*-
+import cProfile
+import logging
+import os
+import pstats
+import tracemalloc
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+import singer
+
+LOGGER: logging.RootLogger = singer.get_logger()
+
+# Stages of a stream: iterating the stream method (fetch, decode and clean)
+# and writing the records (serialize, write and checkpoint)
+STAGE_EXTRACT: str = 'extract'
+STAGE_WRITE: str = 'write'
+
+# Frames kept per allocation trace, the memory report is by line. Every
+# frame adds to the cost of every allocation and snapshot.
+TRACE_FRAMES: int = 1
+
+# Allocation sites in the memory report of a stream
+TOP_ALLOCATIONS: int = 25
+
+# Maximum depth of the collapsed stacks
+MAX_DEPTH: int = 64
+
+MICROSECONDS: int = 1000000
+
+# Only the main thread is profiled, so the requests and the decoding of the
+# responses are made in it while profiling
+PROFILE_CONFIG: MappingProxyType = MappingProxyType({
+    'concurrency': 1,
+    'decode_workers': 0,
+})
+
+# The allocations of the profiler itself are left out
+PROFILER_FILTERS: tuple = (
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, pstats.__file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def function_name(function: tuple) -> str:
+    """Return the name of a pstats function for a collapsed stack.
+
+    Arguments:
+        function {tuple} -- Filename, line number and function name
+
+    Returns:
+        str -- Name
+    """
+    filename, line, name = function
+    if filename == '~':
+        return name
+    return f'{name} ({os.path.basename(filename)}:{line})'
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """Convert profile stats to collapsed stacks.
+
+    cProfile only keeps caller-callee pairs, so the stacks are rebuilt from
+    the roots, and the time of a function is split over its callers in
+    proportion to the time spent in every caller.
+
+    Arguments:
+        stats {pstats.Stats} -- Profile stats
+
+    Returns:
+        Dict[str, int] -- Microseconds of self time per stack
+    """
+    entries: dict = stats.stats  # type: ignore
+    callees: Dict[tuple, List[Tuple[tuple, float]]] = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, caller_time) in callers.items():
+            callees.setdefault(caller, []).append((function, caller_time))
+
+    stacks: Dict[str, int] = {}
+
+    def walk(  # noqa: WPS430
+        function: tuple,
+        scale: float,
+        stack: List[str],
+        seen: Set[tuple],
+    ) -> None:
+        self_time: float = entries[function][2]
+        frames: List[str] = [*stack, function_name(function)]
+        key: str = ';'.join(frames)
+
+        self_us: int = round(self_time * scale * MICROSECONDS)
+        if self_us:
+            stacks[key] = stacks.get(key, 0) + self_us
+
+        if len(frames) >= MAX_DEPTH:
+            return
+
+        for callee, edge_time in callees.get(function, []):
+            callee_total: float = entries[callee][3]
+            if callee in seen or not callee_total:
+                continue
+            walk(
+                callee,
+                scale * edge_time / callee_total,
+                frames,
+                seen | {callee},
+            )
+
+    # Functions are roots for the time that is not spent in a profiled
+    # caller, such as next() resuming the stream method, which is also
+    # called by profiled functions. The profiler itself is left out.
+    for function, (_, _, _, total, callers) in entries.items():
+        if not total or '_lsprof' in function[2]:
+            continue
+        outside: float = total - sum(
+            caller_time
+            for caller, (_, _, _, caller_time) in callers.items()
+            if caller in entries
+        )
+        if round(outside * MICROSECONDS) > 0:
+            walk(function, outside / total, [], {function})
+
+    return stacks
+
+
+class Profiler(object):
+    """Captures cProfile stats and allocations per stream and stage.
+
+    For every stream the profile of every stage is written to
+    <stream>.<stage>.pstats, readable with the pstats module or snakeviz,
+    and to <stream>.<stage>.collapsed, in the collapsed stack format of
+    flamegraph.pl and speedscope. The allocations of the stream are written
+    to <stream>.tracemalloc, a tracemalloc snapshot, and summarized in
+    <stream>.memory.txt. The traces are cleared at the start of a stream and
+    the snapshot is only taken at its end.
+
+    Only the main thread is profiled, create the client with PROFILE_CONFIG
+    to include the requests and the decoding of the payloads.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Initialize the profiler and start tracing allocations.
+
+        Arguments:
+            directory {str} -- Output directory
+        """
+        self.directory: str = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self.profiles: Dict[str, cProfile.Profile] = {}
+
+        tracemalloc.start(TRACE_FRAMES)
+
+    def start(self) -> None:
+        """Start profiling a stream."""
+        self.profiles = {
+            STAGE_EXTRACT: cProfile.Profile(),
+            STAGE_WRITE: cProfile.Profile(),
+        }
+
+        # The snapshot of the stream only holds its own allocations
+        tracemalloc.clear_traces()
+
+        # The peak is per stream from Python 3.9
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+    def iterate(self, rows: Iterator[tuple]) -> Iterator[tuple]:
+        """Profile the iteration of a stream method as the extract stage.
+
+        Arguments:
+            rows {Iterator[tuple]} -- Records of the stream method
+
+        Yields:
+            Iterator[tuple] -- Records
+        """
+        profile: cProfile.Profile = self.profiles[STAGE_EXTRACT]
+        rows = iter(rows)
+
+        while True:
+            profile.enable()
+            try:
+                row: tuple = next(rows)
+            except StopIteration:
+                return
+            finally:
+                profile.disable()
+            yield row
+
+    def call(self, function: Callable) -> Callable:
+        """Profile the calls of a function as the write stage.
+
+        Arguments:
+            function {Callable} -- Function that writes a record
+
+        Returns:
+            Callable -- Profiled function
+        """
+        profile: cProfile.Profile = self.profiles[STAGE_WRITE]
+
+        def profiled(*args: tuple, **kwargs: dict) -> None:  # noqa: WPS430
+            profile.enable()
+            try:
+                function(*args, **kwargs)
+            finally:
+                profile.disable()
+
+        return profiled
+
+    def finish(self, stream: str) -> None:
+        """Write the profiles and allocations of a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot(
+        ).filter_traces(PROFILER_FILTERS)
+
+        for stage, profile in self.profiles.items():
+            path: str = os.path.join(self.directory, f'{stream}.{stage}')
+            profile.dump_stats(f'{path}.pstats')
+
+            # An empty profile can not be loaded as stats
+            if not profile.getstats():
+                continue
+
+            stacks: Dict[str, int] = collapsed_stacks(pstats.Stats(profile))
+            with open(f'{path}.collapsed', 'w') as collapsed_file:
+                for stack, microseconds in stacks.items():
+                    collapsed_file.write(f'{stack} {microseconds}\n')
+
+        path = os.path.join(self.directory, stream)
+        snapshot.dump(f'{path}.tracemalloc')
+        with open(f'{path}.memory.txt', 'w') as memory_file:
+            memory_file.write(
+                f'current: {current} bytes\npeak: {peak} bytes\n\n',
+            )
+            for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+                memory_file.write(f'{stat}\n')
+
+        LOGGER.info(
+            f'Profiled stream {stream}: peak {peak} bytes, written to '
+            f'{self.directory}',
+        )
+
+    def close(self) -> None:
+        """Stop tracing allocations."""
+        tracemalloc.stop()
@@ -0,0 +1,116 @@
+"""Plugin scheduling."""
+# -*- coding: utf-8 -*-
+from datetime import datetime, timezone
+from typing import Generator, List, Optional, Set
+
+# Age in days of a plugin that was never synced
+MAX_AGE_DAYS: int = 30
+
+# Weight of the latest observation in the change rate
+CHANGE_ALPHA: float = 0.3
+
+SECONDS_PER_DAY: int = 86400
+
+
+class PluginScheduler(object):
+    """Orders the plugins of every stream by priority.
+
+    The priority of a plugin is its configured weight, multiplied by the
+    number of days since it was last synced for the stream, and by how often
+    the plugin changes. A change is a new last_updated date in the info
+    stream. The sync times and change rates are kept in the Singer state.
+
+    Plugins that were deferred by the run limits, kept under "deferred" in
+    the Singer state, come first in the next run.
+    """
+
+    def __init__(
+        self,
+        state: dict,
+        weights: Optional[dict] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Arguments:
+            state {dict} -- Singer state
+
+        Keyword Arguments:
+            weights {Optional[dict]} -- Weight per plugin, default 1
+                (default: {None})
+        """
+        self.weights: dict = weights or {}
+
+        scheduler_state: dict = state.setdefault('scheduler', {})
+        self.synced: dict = scheduler_state.setdefault('synced', {})
+        self.changes: dict = scheduler_state.setdefault('changes', {})
+        self.deferred: dict = state.get('deferred', {})
+
+    def priority(self, stream: str, plugin: str) -> float:
+        """Return the priority of a plugin for a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugin {str} -- Plugin
+
+        Returns:
+            float -- Priority, higher is more important
+        """
+        age: float = MAX_AGE_DAYS
+        synced: Optional[str] = self.synced.get(stream, {}).get(plugin)
+        if synced:
+            age = (
+                datetime.now(tz=timezone.utc) - datetime.fromisoformat(synced)
+            ).total_seconds() / SECONDS_PER_DAY
+
+        rate: float = self.changes.get(plugin, {}).get('rate', 0)
+
+        return self.weights.get(plugin, 1) * (1 + age) * (1 + rate)
+
+    def plugins(self, stream: str, plugins: List[str]) -> Generator:
+        """Yield the plugins of a stream by priority, deferred plugins first.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugins {List[str]} -- Plugins
+
+        Yields:
+            Generator -- Plugins
+        """
+        deferred: Set[str] = set(self.deferred.get(stream, []))
+        yield from sorted(
+            plugins,
+            key=lambda plugin: (
+                plugin in deferred,
+                self.priority(stream, plugin),
+            ),
+            reverse=True,
+        )
+
+    def done(self, stream: str, plugin: str) -> None:
+        """Mark a plugin as synced for a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+            plugin {str} -- Plugin
+        """
+        self.synced.setdefault(stream, {})[plugin] = datetime.now(
+            tz=timezone.utc,
+        ).replace(microsecond=0).isoformat()
+
+    def observe(self, plugin: str, last_updated: Optional[str]) -> None:
+        """Update the change rate of a plugin.
+
+        Arguments:
+            plugin {str} -- Plugin
+            last_updated {Optional[str]} -- Last updated date of the plugin
+        """
+        changes: dict = self.changes.setdefault(plugin, {'rate': 0})
+        previous: Optional[str] = changes.get('last_updated')
+
+        if previous is not None:
+            changed: int = int(previous != last_updated)
+            changes['rate'] = round(
+                (1 - CHANGE_ALPHA) * changes['rate'] + CHANGE_ALPHA * changed,
+                4,
+            )
+        changes['last_updated'] = last_updated
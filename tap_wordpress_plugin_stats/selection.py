@@ -0,0 +1,129 @@
+"""Field selection of the catalog."""
+# -*- coding: utf-8 -*-
+from typing import Dict, FrozenSet, List, Optional
+
+from singer import metadata
+from singer.catalog import Catalog, CatalogEntry
+
+from tap_wordpress_plugin_stats.streams import STREAMS
+
+# Fields that identify a record are always synced
+AUTOMATIC_FIELDS: FrozenSet[str] = frozenset(('plugin',))
+
+
+def automatic_fields(stream: str) -> FrozenSet[str]:
+    """Return the fields of a stream that can not be deselected.
+
+    Arguments:
+        stream {str} -- Stream name
+
+    Returns:
+        FrozenSet[str] -- Plugin and bookmark fields of the stream
+    """
+    mapping: dict = STREAMS[stream].get('mapping', {})
+
+    return frozenset(
+        field for field in (*AUTOMATIC_FIELDS, STREAMS[stream].get('bookmark'))
+        if field in mapping
+    )
+
+
+def _field_selected(
+    mdata: dict,
+    properties: dict,
+    field: str,
+) -> bool:
+    """Return whether a field is selected.
+
+    A field is deselected by "selected": false in its metadata, or in its
+    schema, or by removing it from the schema.
+
+    Arguments:
+        mdata {dict} -- Metadata map of the stream
+        properties {dict} -- Schema properties of the stream
+        field {str} -- Field
+
+    Returns:
+        bool -- Whether the field is selected
+    """
+    if field not in properties:
+        return False
+
+    field_meta: dict = mdata.get(('properties', field), {})
+    if field_meta.get('inclusion') == 'automatic':
+        return True
+    if field_meta.get('selected') is not None:
+        return field_meta['selected']
+    if properties[field].selected is not None:
+        return properties[field].selected
+
+    return field_meta.get('selected-by-default', True)
+
+
+def selected_fields(entry: CatalogEntry) -> Optional[FrozenSet[str]]:
+    """Return the selected fields of a catalog entry.
+
+    Arguments:
+        entry {CatalogEntry} -- Catalog entry
+
+    Returns:
+        Optional[FrozenSet[str]] -- Selected fields, None if all fields are
+            selected
+    """
+    stream: str = entry.tap_stream_id
+    mapping: dict = STREAMS[stream].get('mapping', {})
+    mdata: dict = metadata.to_map(entry.metadata or [])
+    properties: dict = entry.schema.properties or {}
+    automatic: FrozenSet[str] = automatic_fields(stream)
+
+    fields: List[str] = [
+        field
+        for field in (
+            key_mapping.get('map') or key
+            for key, key_mapping in mapping.items()
+        )
+        if field in automatic or _field_selected(mdata, properties, field)
+    ]
+
+    if len(fields) == len(mapping):
+        return None
+    return frozenset(fields)
+
+
+def selection(catalog: Catalog) -> Dict[str, Optional[FrozenSet[str]]]:
+    """Return the selected fields of every selected stream.
+
+    Arguments:
+        catalog {Catalog} -- Stream catalog
+
+    Returns:
+        Dict[str, Optional[FrozenSet[str]]] -- Selected fields per stream,
+            None if all fields are selected
+    """
+    return {
+        entry.tap_stream_id: selected_fields(entry)
+        for entry in catalog.get_selected_streams({})
+    }
+
+
+def selected_schema(
+    entry: CatalogEntry,
+    fields: Optional[FrozenSet[str]],
+) -> dict:
+    """Return the schema of a catalog entry with only the selected fields.
+
+    Arguments:
+        entry {CatalogEntry} -- Catalog entry
+        fields {Optional[FrozenSet[str]]} -- Selected fields, None for all
+
+    Returns:
+        dict -- Schema
+    """
+    schema: dict = entry.schema.to_dict()
+    if fields is not None:
+        schema['properties'] = {
+            field: field_schema
+            for field, field_schema in schema.get('properties', {}).items()
+            if field in fields
+        }
+    return schema
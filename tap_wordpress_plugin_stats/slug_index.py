@@ -0,0 +1,103 @@
+"""Local index of plugin metadata by slug."""
+# -*- coding: utf-8 -*-
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional
+
+from tap_wordpress_plugin_stats.cleaners import INFO_KEYS
+from tap_wordpress_plugin_stats.streams import date_parser
+
+# Keys of the plugin metadata that the info stream reads. The other keys of
+# the payload, such as the sections and versions, are not indexed.
+INDEX_KEYS: tuple = (*INFO_KEYS, 'ratings')
+
+
+def updated_at(plugin_data: dict) -> Optional[datetime]:
+    """Return the last updated time of plugin metadata.
+
+    Arguments:
+        plugin_data {dict} -- Plugin metadata from the API
+
+    Returns:
+        Optional[datetime] -- Last updated time, None if it is unknown
+    """
+    last_updated: Optional[str] = plugin_data.get('last_updated')
+    if not last_updated:
+        return None
+    return datetime.fromisoformat(date_parser(last_updated))
+
+
+def indexed(plugin_data: dict) -> dict:
+    """Return the indexed keys of plugin metadata.
+
+    Arguments:
+        plugin_data {dict} -- Plugin metadata from the API
+
+    Returns:
+        dict -- Plugin metadata with only the keys in INDEX_KEYS
+    """
+    return {key: plugin_data[key] for key in INDEX_KEYS if key in plugin_data}
+
+
+class SlugIndex(object):
+    """Plugin metadata by slug, persisted in a JSON file.
+
+    The index holds the metadata of the tracked plugins that the info stream
+    reads, as returned by the API for their exact slug, and the time of the
+    last refresh. Plugins that
+    were updated since the last refresh are found by browsing the recently
+    updated plugins.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Load the index, a missing file is an empty index.
+
+        Arguments:
+            path {str} -- Index path
+        """
+        self.path: str = path
+        self.refreshed: Optional[str] = None
+        self.plugins: Dict[str, dict] = {}
+
+        if os.path.exists(path):
+            with open(path) as index_file:
+                index: dict = json.load(index_file)
+            self.refreshed = index.get('refreshed')
+            self.plugins = {
+                slug: indexed(plugin_data)
+                for slug, plugin_data in index.get('plugins', {}).items()
+            }
+
+    def get(self, slug: str) -> Optional[dict]:
+        """Return the metadata of a slug.
+
+        Arguments:
+            slug {str} -- Plugin
+
+        Returns:
+            Optional[dict] -- Plugin metadata, None if the slug is unknown
+        """
+        return self.plugins.get(slug)
+
+    def update(self, slug: str, plugin_data: dict) -> None:
+        """Set the metadata of a slug.
+
+        Arguments:
+            slug {str} -- Plugin
+            plugin_data {dict} -- Plugin metadata from the API
+        """
+        self.plugins[slug] = indexed(plugin_data)
+
+    def save(self) -> None:
+        """Write the index.
+
+        The index is written under a temporary name and renamed when it is
+        complete, so an interrupted write keeps the previous index.
+        """
+        with open(f'{self.path}.tmp', 'w') as index_file:
+            json.dump(
+                {'refreshed': self.refreshed, 'plugins': self.plugins},
+                index_file,
+            )
+        os.replace(f'{self.path}.tmp', self.path)
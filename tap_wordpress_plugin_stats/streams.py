@@ -254,6 +254,9 @@ def date_parser(input_date: str) -> str:
 
 
 # Streams metadata
+# The optional 'field' of a mapping is the query_plugins and
+# plugin_information field flag of the WordPress.org API that returns the
+# value. Streams with the same optional 'payload' read the same responses.
 STREAMS: MappingProxyType = MappingProxyType({
     'active_versions': {
         'key_properties': 'id',
@@ -281,6 +284,7 @@ STREAMS: MappingProxyType = MappingProxyType({
         'replication_method': 'INCREMENTAL',
         'replication_key': 'id',
         'bookmark': 'date',
+        'payload': 'active_installs',
         'mapping': {
             'plugin': {
                 'mapping': 'plugin',
@@ -299,6 +303,7 @@ STREAMS: MappingProxyType = MappingProxyType({
         'replication_method': 'INCREMENTAL',
         'replication_key': 'id',
         'bookmark': 'date',
+        'payload': 'downloads',
         'mapping': {
             'plugin': {
                 'mapping': 'plugin',
@@ -347,6 +352,7 @@ STREAMS: MappingProxyType = MappingProxyType({
         'replication_method': 'INCREMENTAL',
         'replication_key': 'id',
         'bookmark': 'date',
+        'payload': 'plugin_information',
         'mapping': {
             'plugin': {
                 'mapping': 'plugin',
@@ -356,46 +362,57 @@ STREAMS: MappingProxyType = MappingProxyType({
             },
             'active_installs': {
                 'mapping': 'active_installs',
+                'field': 'active_installs',
                 'type': int,
             },
             'downloaded': {
                 'mapping': 'downloaded',
+                'field': 'downloaded',
                 'type': int,
             },
             'last_updated': {
                 'mapping': 'last_updated',
+                'field': 'last_updated',
                 'type': date_parser,
             },
             'num_ratings': {
                 'mapping': 'num_ratings',
+                'field': 'rating',
                 'type': int,
             },
             'rating': {
                 'mapping': 'rating',
+                'field': 'rating',
                 'type': int,
             },
             'ratings_0': {
                 'mapping': 'ratings_0',
+                'field': 'ratings',
                 'type': int,
             },
             'ratings_1': {
                 'mapping': 'ratings_1',
+                'field': 'ratings',
                 'type': int,
             },
             'ratings_2': {
                 'mapping': 'ratings_2',
+                'field': 'ratings',
                 'type': int,
             },
             'ratings_3': {
                 'mapping': 'ratings_3',
+                'field': 'ratings',
                 'type': int,
             },
             'ratings_4': {
                 'mapping': 'ratings_4',
+                'field': 'ratings',
                 'type': int,
             },
             'ratings_5': {
                 'mapping': 'ratings_5',
+                'field': 'ratings',
                 'type': int,
             },
             'support_threads': {
@@ -411,4 +428,210 @@ STREAMS: MappingProxyType = MappingProxyType({
             },
         },
     },
+    'plugin_information': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'timestamp',
+        'payload': 'plugin_information',
+        'mapping': {
+            'plugin': {
+                'mapping': 'plugin',
+            },
+            'timestamp': {
+                'mapping': 'timestamp',
+            },
+            'name': {
+                'mapping': 'name',
+            },
+            'version': {
+                'mapping': 'version',
+            },
+            'requires': {
+                'mapping': 'requires',
+                'field': 'requires',
+            },
+            'tested': {
+                'mapping': 'tested',
+                'field': 'tested',
+            },
+            'requires_php': {
+                'mapping': 'requires_php',
+                'field': 'requires_php',
+            },
+            'added': {
+                'mapping': 'added',
+                'field': 'added',
+                'type': date_parser,
+            },
+            'last_updated': {
+                'mapping': 'last_updated',
+                'field': 'last_updated',
+                'type': date_parser,
+            },
+            'homepage': {
+                'mapping': 'homepage',
+                'field': 'homepage',
+            },
+            'active_installs': {
+                'mapping': 'active_installs',
+                'field': 'active_installs',
+                'type': int,
+            },
+            'downloaded': {
+                'mapping': 'downloaded',
+                'field': 'downloaded',
+                'type': int,
+            },
+            'num_ratings': {
+                'mapping': 'num_ratings',
+                'field': 'rating',
+                'type': int,
+            },
+            'rating': {
+                'mapping': 'rating',
+                'field': 'rating',
+                'type': int,
+            },
+            'support_threads': {
+                'mapping': 'support_threads',
+                'type': int,
+            },
+            'support_threads_resolved': {
+                'mapping': 'support_threads_resolved',
+                'type': int,
+            },
+            'sections': {
+                'mapping': 'sections',
+                'field': 'sections',
+            },
+        },
+    },
+    'plugin_versions': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'timestamp',
+        'payload': 'plugin_information',
+        'mapping': {
+            'plugin': {
+                'mapping': 'plugin',
+            },
+            'timestamp': {
+                'mapping': 'timestamp',
+            },
+            'version': {
+                'mapping': 'version',
+            },
+            'download_link': {
+                'mapping': 'download_link',
+                'field': 'versions',
+            },
+        },
+    },
+    'wordpress_versions': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'timestamp',
+        'mapping': {
+            'timestamp': {
+                'mapping': 'timestamp',
+            },
+            'version': {
+                'mapping': 'version',
+            },
+            'percentage': {
+                'mapping': 'percentage',
+                'type': Decimal,
+            },
+        },
+    },
+    'php_versions': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'timestamp',
+        'mapping': {
+            'timestamp': {
+                'mapping': 'timestamp',
+            },
+            'version': {
+                'mapping': 'version',
+            },
+            'percentage': {
+                'mapping': 'percentage',
+                'type': Decimal,
+            },
+        },
+    },
+    'downloads_weekly': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'week',
+        'payload': 'downloads',
+        'mapping': {
+            'plugin': {
+                'mapping': 'plugin',
+            },
+            'week': {
+                'mapping': 'week',
+            },
+            'downloads': {
+                'mapping': 'downloads',
+                'type': int,
+            },
+            'days': {
+                'mapping': 'days',
+                'type': int,
+            },
+        },
+    },
+    'downloads_monthly': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'month',
+        'payload': 'downloads',
+        'mapping': {
+            'plugin': {
+                'mapping': 'plugin',
+            },
+            'month': {
+                'mapping': 'month',
+            },
+            'downloads': {
+                'mapping': 'downloads',
+                'type': int,
+            },
+            'days': {
+                'mapping': 'days',
+                'type': int,
+            },
+        },
+    },
+    'active_installs_delta': {
+        'key_properties': 'id',
+        'replication_method': 'INCREMENTAL',
+        'replication_key': 'id',
+        'bookmark': 'date',
+        'payload': 'active_installs',
+        'mapping': {
+            'plugin': {
+                'mapping': 'plugin',
+            },
+            'date': {
+                'mapping': 'date',
+            },
+            'percentage': {
+                'mapping': 'percentage',
+                'type': Decimal,
+            },
+            'delta': {
+                'mapping': 'delta',
+                'type': Decimal,
+            },
+        },
+    },
 })
@@ -2,11 +2,15 @@
 # -*- coding: utf-8 -*-
 import logging
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Callable, Dict, Iterator, Optional
 
 import singer
 from singer.catalog import Catalog
 
+from tap_wordpress_plugin_stats.cleaners import projection
+from tap_wordpress_plugin_stats.profiling import Profiler
+from tap_wordpress_plugin_stats.selection import selected_schema, selection
+from tap_wordpress_plugin_stats.validation import RecordValidator
 from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
     WordPressPluginStats,  # noqa: I001
 )  # noqa: I001
@@ -14,29 +18,63 @@ from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
 LOGGER: logging.RootLogger = singer.get_logger()
 
 
+def write_row(stream: str, row: tuple) -> None:
+    """Write a compact record as a Singer record message.
+
+    Arguments:
+        stream {str} -- Stream name
+        row {tuple} -- Compact record
+    """
+    singer.write_record(
+        stream,
+        row._asdict(),
+        time_extracted=datetime.now(timezone.utc),
+    )
+
+
 def sync(  # noqa: WPS210, WPS213
     wp: WordPressPluginStats,
     catalog: Catalog,
-) -> None:
+    validate_every: int = 0,
+    profiler: Optional[Profiler] = None,
+) -> Dict[str, int]:
     """Sync data from tap source.
 
     Arguments:
         wp {WordPressPluginStats} -- WordPressPluginStats client
         catalog {Catalog} -- Stream catalog
+
+    Keyword Arguments:
+        validate_every {int} -- Validate 1 in N records against the schema,
+            0 trusts the cleaners (default: {0})
+        profiler {Optional[Profiler]} -- Profiler of the streams
+            (default: {None})
+
+    Returns:
+        Dict[str, int] -- Number of records written per stream
     """
     # For every stream in the catalog
     LOGGER.info('Sync')
+    counts: Dict[str, int] = {}
+
+    # Deselected fields are neither requested nor cleaned
+    wp.selection = selection(catalog)
 
     # Only selected streams are synced, whether a stream is selected is
     # determined by whether the key-value: "selected": true is in the schema
     # file.
-    for stream in catalog.get_selected_streams({}):
+    # An interrupted sync resumes at the stream that was syncing
+    for stream in catalog.get_selected_streams(wp.state):
         LOGGER.info(f'Syncing stream: {stream.tap_stream_id}')
+        wp.checkpoint.start(stream.tap_stream_id)
 
-        # Write the schema
+        # Write the schema of the selected fields
         singer.write_schema(
             stream_name=stream.tap_stream_id,
-            schema=stream.schema.to_dict(),
+            schema=selected_schema(
+                stream,
+                wp.selection[stream.tap_stream_id],
+            ),
             key_properties=stream.key_properties,
         )
 
@@ -44,12 +82,61 @@ def sync(  # noqa: WPS210, WPS213
         # The stream: mysql will call: wp.mysql
         tap_data: Callable = getattr(wp, stream.tap_stream_id)
 
-        # The tap_data method yields rows of data from the API
-        for row in tap_data():
+        # Compile the schema of the stream once
+        validator: Optional[RecordValidator] = None
+        if validate_every:
+            validator = RecordValidator(
+                stream.tap_stream_id,
+                stream.schema.to_dict(),
+                projection(
+                    stream.tap_stream_id,
+                    wp.selection[stream.tap_stream_id],
+                )[0]._fields,
+                validate_every,
+            )
+
+        # The tap_data method yields compact records of data from the API,
+        # they are only converted to a dictionary when written
+        rows: Iterator[tuple] = tap_data()
+        write: Callable[[str, tuple], None] = write_row
+
+        # Profile the extract and write stages of the stream
+        if profiler:
+            profiler.start()
+            rows = profiler.iterate(rows)
+            write = profiler.call(write_row)
+
+        counts[stream.tap_stream_id] = 0
+        for row in rows:
+
+            if validator:
+                validator(row)
 
             # Write a row to the stream
-            singer.write_record(
-                stream.tap_stream_id,
-                row,
-                time_extracted=datetime.now(timezone.utc),
+            write(stream.tap_stream_id, row)
+            counts[stream.tap_stream_id] += 1
+            wp.checkpoint.record()
+
+        if profiler:
+            profiler.finish(stream.tap_stream_id)
+
+        if validator:
+            LOGGER.info(
+                f'Validated {validator.validated} of {validator.seen} '
+                f'{stream.tap_stream_id} records',
             )
+
+        # Write the bookmarks of the stream
+        wp.checkpoint.flush()
+
+    # Report the usage and the deferred work of the run
+    if wp.controller:
+        wp.controller.finish()
+
+    # The sync is complete, the next run starts from the beginning
+    wp.checkpoint.finish()
+
+    LOGGER.info(f'Payload cache: {wp.cache.stats()}')
+    LOGGER.info(f'Transfer: {wp.transfer.stats()}')
+
+    return counts
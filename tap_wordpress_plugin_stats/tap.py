@@ -1,15 +1,28 @@
 """WordPress Plugin Stats tap."""
 # -*- coding: utf-8 -*-
 import logging
-from argparse import Namespace
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import Optional
 
 import pkg_resources
 from singer import get_logger, utils
 from singer.catalog import Catalog
 
+from tap_wordpress_plugin_stats.cache import DEFAULT_MAX_BYTES
+from tap_wordpress_plugin_stats.checkpoint import (  # noqa: I001
+    DEFAULT_SECONDS,  # noqa: I001
+    CheckpointPolicy,  # noqa: I001
+)  # noqa: I001
+from tap_wordpress_plugin_stats.controller import RunController
 from tap_wordpress_plugin_stats.discover import discover
+from tap_wordpress_plugin_stats.gaps import DEFAULT_OVERLAP
+from tap_wordpress_plugin_stats.profiling import PROFILE_CONFIG, Profiler
+from tap_wordpress_plugin_stats.scheduler import PluginScheduler
 from tap_wordpress_plugin_stats.sync import sync
 from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    API_BASE_PATH,  # noqa: I001
+    DEFAULT_DECODE_WORKERS,  # noqa: I001
     WordPressPluginStats,  # noqa: I001
 )  # noqa: I001
 
@@ -20,10 +33,95 @@ LOGGER: logging.RootLogger = get_logger()
 REQUIRED_CONFIG_KEYS: tuple = ('plugins',)
 
 
+def create_controller(
+    config: dict,
+    wp: WordPressPluginStats,
+) -> RunController:
+    """Initialize the run controller from the config, the run starts now.
+
+    Arguments:
+        config {dict} -- Tap config
+        wp {WordPressPluginStats} -- WordPressPluginStats client
+
+    Returns:
+        RunController -- Run controller
+    """
+    return RunController(
+        wp.state,
+        max_requests=config.get('max_requests'),
+        max_runtime=config.get('max_runtime_seconds'),
+        max_bytes=config.get('max_bytes'),
+        parallel=wp.concurrency + wp.decode_workers,
+    )
+
+
+def create_client(config: dict, state: dict) -> WordPressPluginStats:
+    """Initialize the WordPress client from the config.
+
+    Arguments:
+        config {dict} -- Tap config
+        state {dict} -- Singer state
+
+    Returns:
+        WordPressPluginStats -- WordPressPluginStats client
+    """
+    wp: WordPressPluginStats = WordPressPluginStats(
+        config['plugins'],
+        concurrency=config.get('concurrency', 1),
+        cache_max_bytes=config.get('cache_max_bytes', DEFAULT_MAX_BYTES),
+        state=state,
+        overlap=config.get('downloads_overlap_days', DEFAULT_OVERLAP),
+        archive=config.get('downloads_archive'),
+        from_archive=config.get('downloads_from_archive', False),
+        slug_index=config.get('slug_index'),
+        skip_unchanged=config.get('info_skip_unchanged', False),
+        api_base_url=config.get('api_base_url', API_BASE_PATH),
+        decode_workers=config.get('decode_workers', DEFAULT_DECODE_WORKERS),
+    )
+
+    # Schedule the plugins by priority
+    wp.scheduler = PluginScheduler(
+        wp.state,
+        weights=config.get('plugin_weights'),
+    )
+
+    # Stop admitting plugins when a limit of the run is near
+    wp.controller = create_controller(config, wp)
+
+    # Write the state by record count, elapsed time and plugin boundaries
+    wp.checkpoint = CheckpointPolicy(
+        wp.state,
+        plugins=wp.plugins,
+        every_records=config.get('checkpoint_records', 0),
+        every_seconds=config.get('checkpoint_seconds', DEFAULT_SECONDS),
+        plugin_boundaries=config.get('checkpoint_plugins', False),
+    )
+
+    return wp
+
+
+def parse_profile_arg() -> Optional[str]:
+    """Remove the --profile argument from the command line arguments.
+
+    The Singer arguments parser does not allow other arguments.
+
+    Returns:
+        Optional[str] -- Profile output directory
+    """
+    parser: ArgumentParser = ArgumentParser(add_help=False)
+    parser.add_argument('--profile', metavar='DIR')
+
+    known, remaining = parser.parse_known_args()
+    sys.argv[1:] = remaining
+
+    return known.profile
+
+
 @utils.handle_top_exception(LOGGER)
-def main() -> None:
+def main() -> None:  # noqa: WPS210
     """Run tap."""
     # Parse command line arguments
+    profile_dir: Optional[str] = parse_profile_arg()
     args: Namespace = utils.parse_args(REQUIRED_CONFIG_KEYS)
 
     LOGGER.info(f'>>> Running tap-wordpress-plugin-stats v{VERSION}')
@@ -42,10 +140,27 @@ def main() -> None:
         # Loadt the  catalog
         catalog = discover()
 
-    # Initialize WordPress client
-    wp: WordPressPluginStats = WordPressPluginStats(args.config['plugins'])
+    # Initialize WordPress client, in a single thread when profiling
+    config: dict = args.config
+    if profile_dir:
+        config = {**config, **PROFILE_CONFIG}
+    wp: WordPressPluginStats = create_client(config, args.state)
+
+    # Profile the streams when --profile DIR is passed
+    profiler: Optional[Profiler] = None
+    if profile_dir:
+        profiler = Profiler(profile_dir)
 
-    sync(wp, catalog)
+    try:
+        sync(
+            wp,
+            catalog,
+            validate_every=args.config.get('validate_records', 0),
+            profiler=profiler,
+        )
+    finally:
+        if profiler:
+            profiler.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,197 @@
+"""Record validation."""
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Callable, List, Tuple
+
+from dateutil.parser import isoparse
+
+
+class RecordValidationError(ValueError):
+    """Record does not match the schema."""
+
+
+def _is_number(input_value: Any) -> bool:
+    """Return whether the value is a number.
+
+    Arguments:
+        input_value {Any} -- Input value
+
+    Returns:
+        bool -- Whether the value matches
+    """
+    return isinstance(
+        input_value,
+        (int, float, Decimal),
+    ) and not isinstance(input_value, bool)
+
+
+def _is_integer(input_value: Any) -> bool:
+    """Return whether the value is an integral number.
+
+    Arguments:
+        input_value {Any} -- Input value
+
+    Returns:
+        bool -- Whether the value matches
+    """
+    return _is_number(input_value) and input_value == int(input_value)
+
+
+def _is_date(input_value: Any) -> bool:
+    """Return whether the value is an ISO 8601 date or date-time.
+
+    Arguments:
+        input_value {Any} -- Input value
+
+    Returns:
+        bool -- Whether the value matches
+    """
+    try:
+        isoparse(input_value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+# Predicates of JSON schema types
+TYPES: MappingProxyType = MappingProxyType({
+    'null': lambda input_value: input_value is None,
+    'boolean': lambda input_value: isinstance(input_value, bool),
+    'integer': _is_integer,
+    'number': _is_number,
+    'string': lambda input_value: isinstance(input_value, str),
+    'object': lambda input_value: isinstance(input_value, dict),
+    'array': lambda input_value: isinstance(input_value, (list, tuple)),
+})
+
+# Predicates of JSON schema formats
+FORMATS: MappingProxyType = MappingProxyType({
+    'date': _is_date,
+    'date-time': _is_date,
+    'integer': _is_integer,
+})
+
+
+def compile_property(schema: dict) -> Callable[[Any], bool]:  # noqa: WPS231
+    """Compile the schema of a property into a predicate.
+
+    Supports the keywords type, format, minimum and maximum. Formats and
+    ranges are only checked for values that are not None.
+
+    Arguments:
+        schema {dict} -- JSON schema of the property
+
+    Returns:
+        Callable[[Any], bool] -- Returns whether a value matches the schema
+    """
+    types: Any = schema.get('type', [])
+    if isinstance(types, str):
+        types = [types]
+
+    type_checks: Tuple[Callable, ...] = tuple(
+        TYPES[type_name] for type_name in types
+    )
+    value_checks: List[Callable] = []
+
+    if schema.get('format') in FORMATS:
+        value_checks.append(FORMATS[schema['format']])
+    if 'minimum' in schema:
+        minimum: Any = schema['minimum']
+        value_checks.append(
+            lambda input_value: input_value >= minimum,  # noqa: WPS430
+        )
+    if 'maximum' in schema:
+        maximum: Any = schema['maximum']
+        value_checks.append(
+            lambda input_value: input_value <= maximum,  # noqa: WPS430
+        )
+
+    def check(input_value: Any) -> bool:  # noqa: WPS430
+        """Return whether the value matches the schema.
+
+        Arguments:
+            input_value {Any} -- Input value
+
+        Returns:
+            bool -- Whether the value matches
+        """
+        if type_checks and not any(
+            type_check(input_value) for type_check in type_checks
+        ):
+            return False
+        if input_value is None:
+            return True
+        return all(
+            value_check(input_value) for value_check in value_checks
+        )
+
+    return check
+
+
+class RecordValidator(object):
+    """Validates records of a stream against its schema.
+
+    The schema is compiled once into a predicate per record field. With a
+    sample rate of N, only 1 in N records is validated.
+    """
+
+    def __init__(
+        self,
+        stream: str,
+        schema: dict,
+        fields: Tuple[str, ...],
+        sample_rate: int = 1,
+    ) -> None:
+        """Compile the schema.
+
+        Arguments:
+            stream {str} -- Stream name
+            schema {dict} -- JSON schema of the stream
+            fields {Tuple[str, ...]} -- Fields of the records, in order
+
+        Keyword Arguments:
+            sample_rate {int} -- Validate 1 in N records (default: {1})
+
+        Raises:
+            RecordValidationError: When a field is not in the schema
+        """
+        self.stream: str = stream
+        self.sample_rate: int = max(sample_rate, 1)
+        self.seen: int = 0
+        self.validated: int = 0
+
+        properties: dict = schema.get('properties', {})
+        unknown: List[str] = [
+            field for field in fields if field not in properties
+        ]
+        if unknown and schema.get('additionalProperties') is False:
+            raise RecordValidationError(
+                f'Fields {unknown} of {stream} are not in the schema',
+            )
+
+        self.checks: Tuple[Tuple[str, Callable], ...] = tuple(
+            (field, compile_property(properties.get(field, {})))
+            for field in fields
+        )
+
+    def __call__(self, record: tuple) -> None:
+        """Validate a record, if it is sampled.
+
+        Arguments:
+            record {tuple} -- Record with values in the order of the fields
+
+        Raises:
+            RecordValidationError: When the record does not match the schema
+        """
+        self.seen += 1
+        if self.seen % self.sample_rate:
+            return
+        self.validated += 1
+
+        for (field, check), input_value in zip(self.checks, record):
+            if not check(input_value):
+                raise RecordValidationError(
+                    f'Invalid {self.stream} record: {field}={input_value!r} '
+                    f'does not match the schema, record: {record}',
+                )
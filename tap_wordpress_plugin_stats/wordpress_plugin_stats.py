@@ -1,12 +1,52 @@
 """WordPress.org stats fetcher."""
 
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from types import MappingProxyType
-from typing import Callable, Generator, List, Union
+from typing import (  # noqa: I001
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import httpx
 
+from tap_wordpress_plugin_stats.aggregates import (  # noqa: I001
+    deltas,  # noqa: I001
+    month_start,  # noqa: I001
+    next_month,  # noqa: I001
+    next_week,  # noqa: I001
+    totals,  # noqa: I001
+    week_start,  # noqa: I001
+)  # noqa: I001
+from tap_wordpress_plugin_stats.archive import SeriesArchive, update_archive
+from tap_wordpress_plugin_stats.cache import DEFAULT_MAX_BYTES, PayloadCache
+from tap_wordpress_plugin_stats.checkpoint import CheckpointPolicy
 from tap_wordpress_plugin_stats.cleaners import CLEANERS
+from tap_wordpress_plugin_stats.controller import RunController
+from tap_wordpress_plugin_stats.decoding import ACCEPT_ENCODING, TransferStats
+from tap_wordpress_plugin_stats.gaps import (  # noqa: I001
+    DEFAULT_OVERLAP,  # noqa: I001
+    downloads_bookmark,  # noqa: I001
+    repair_window,  # noqa: I001
+    revised_dates,  # noqa: I001
+    window,  # noqa: I001
+)  # noqa: I001
+from tap_wordpress_plugin_stats.scheduler import PluginScheduler
+from tap_wordpress_plugin_stats.slug_index import SlugIndex, updated_at
+from tap_wordpress_plugin_stats.streams import STREAMS
 
 API_SCHEME: str = 'https://'
 API_BASE_URL: str = 'api.wordpress.org'
@@ -21,212 +61,1001 @@ ENDPOINT_DOWNLOADS: str = (
 ENDPOINT_DOWNLOADS_SUMMARY: str = (
     '/stats/plugin/1.0/downloads.php?slug=:plugin:&historical_summary=1'
 )
-ENDPOINT_INFO: str = (
-    '/plugins/info/1.2/?action=query_plugins&request[per_page]'
-    '=1&request[search]=:plugin:'
+ENDPOINT_INFO_FIELD: str = '&request[fields][:field:]=:value:'
+ENDPOINT_INFO_UPDATED: str = (
+    '/plugins/info/1.2/?action=query_plugins&request[browse]=updated'
+    '&request[per_page]=:per_page:&request[page]=:page:'
+)
+ENDPOINT_PLUGIN_INFORMATION: str = (
+    '/plugins/info/1.2/?action=plugin_information&request[slug]=:plugin:'
+)
+ENDPOINT_WORDPRESS_VERSIONS: str = '/stats/wordpress/1.0/'
+ENDPOINT_PHP_VERSIONS: str = '/stats/php/1.0/'
+
+# Heavy query_plugins fields that are turned off unless a stream needs them
+INFO_OPTIONAL_FIELDS: tuple = (
+    'added',
+    'banners',
+    'compatibility',
+    'contributors',
+    'description',
+    'donate_link',
+    'downloadlink',
+    'homepage',
+    'icons',
+    'requires',
+    'requires_php',
+    'reviews',
+    'screenshots',
+    'sections',
+    'short_description',
+    'tags',
+    'tested',
+    'versions',
 )
 
+# Field flags of all streams, turned off unless a selected field needs them
+FIELD_FLAGS: tuple = tuple(dict.fromkeys(
+    key_mapping['field']
+    for stream_meta in STREAMS.values()
+    for key_mapping in stream_meta.get('mapping', {}).values()
+    if key_mapping.get('field')
+))
+
+# Recently updated plugins per page, and the maximum number of pages, when
+# the slug index is refreshed
+INDEX_PAGE_SIZE: int = 250
+INDEX_MAX_PAGES: int = 40
+
+# Plugins updated this long before the last refresh are browsed again, in
+# case the API was behind
+INDEX_OVERLAP: timedelta = timedelta(hours=1)
+
+# The slug index needs the last updated time of every plugin
+INDEX_MAPPING: MappingProxyType = MappingProxyType({
+    'last_updated': {'field': 'last_updated'},
+})
+
 headers: MappingProxyType = MappingProxyType({
     'User-Agent': (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
         'AppleWebKit/537.36 (KHTML, like Gecko) '
         'Chrome/74.0.3729.131 Safari/537.36'
     ),
+    'Accept-Encoding': ACCEPT_ENCODING,
 })
 
+# Threads that decode responses while the next requests are made
+DEFAULT_DECODE_WORKERS: int = 1
+
+
+def info_fields(*mappings: dict) -> str:
+    """Return the field flags that the mappings need.
+
+    The fields of the mappings are turned on, the other heavy fields and the
+    fields of deselected keys are turned off, so the API only returns what is
+    cleaned.
+
+    Arguments:
+        mappings {dict} -- Stream mappings, or the selected part of them
+
+    Returns:
+        str -- Field flags query string
+    """
+    needed: List[str] = list(dict.fromkeys(
+        key_mapping['field']
+        for mapping in mappings
+        for key_mapping in mapping.values()
+        if key_mapping.get('field')
+    ))
+
+    flags: dict = {
+        field: 0 for field in (*INFO_OPTIONAL_FIELDS, *FIELD_FLAGS)
+    }
+    flags.update({field: 1 for field in needed})
+
+    return ''.join(
+        ENDPOINT_INFO_FIELD.replace(
+            ':field:',
+            field,
+        ).replace(
+            ':value:',
+            str(value_flag),
+        )
+        for field, value_flag in flags.items()
+    )
+
 
 class PluginNotFoundException(Exception):
     """Exception for when plugin is not found."""
 
 
 class WordPressPluginStats(object):
-    """WordPress PluginStats."""
+    """WordPress PluginStats.
+
+    The selection holds the selected fields per selected stream, None for all
+    fields. Deselected fields are not requested where the API allows it, and
+    not cleaned. Without a selection every field of every stream is synced.
+    """
 
-    def __init__(self, plugins: Union[List[str], str]) -> None:
+    def __init__(
+        self,
+        plugins: Union[List[str], str],
+        concurrency: int = 1,
+        cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        state: Optional[dict] = None,
+        overlap: int = DEFAULT_OVERLAP,
+        archive: Optional[str] = None,
+        from_archive: bool = False,
+        slug_index: Optional[str] = None,
+        skip_unchanged: bool = False,
+        api_base_url: str = API_BASE_PATH,
+        decode_workers: int = DEFAULT_DECODE_WORKERS,
+    ) -> None:
         """Initialize plugin stats api.
 
         Arguments:
             plugins {Union[List[str], str]} -- Name of the plugins
+
+        Keyword Arguments:
+            concurrency {int} -- Number of parallel requests (default: {1})
+            cache_max_bytes {int} -- Memory cap of the payload cache
+                (default: {DEFAULT_MAX_BYTES})
+            state {Optional[dict]} -- Singer state (default: {None})
+            overlap {int} -- Days before the downloads bookmark that are
+                fetched and verified again (default: {DEFAULT_OVERLAP})
+            archive {Optional[str]} -- Path of the downloads archive
+                (default: {None})
+            from_archive {bool} -- Emit downloads from the archive instead of
+                fetching them (default: {False})
+            slug_index {Optional[str]} -- Path of the slug index
+                (default: {None})
+            skip_unchanged {bool} -- Skip the info of plugins that were not
+                updated since the last refresh of the slug index
+                (default: {False})
+            api_base_url {str} -- Scheme and host of the API
+                (default: {API_BASE_PATH})
+            decode_workers {int} -- Number of responses that are decoded
+                while other requests are made (default:
+                {DEFAULT_DECODE_WORKERS})
         """
+        # Set plugin or plugins, without duplicates
+        if isinstance(plugins, str):
+            self.plugins = [plugins]
+        else:
+            self.plugins = list(dict.fromkeys(plugins))
+
+        self.state: dict = state if state is not None else {}
+        self.overlap: int = overlap
+        self.archive: Optional[str] = archive
+        self.from_archive: bool = from_archive
+        self.slug_index: Optional[SlugIndex] = None
+        if slug_index:
+            self.slug_index = SlugIndex(slug_index)
+        self.skip_unchanged: bool = skip_unchanged
+        self.api_base_url: str = api_base_url.rstrip('/')
+        self.scheduler: Optional[PluginScheduler] = None
+        self.controller: Optional[RunController] = None
+        self.selection: Optional[Dict[str, Optional[FrozenSet[str]]]] = None
+        self.checkpoint: CheckpointPolicy = CheckpointPolicy(
+            self.state,
+            plugins=self.plugins,
+        )
+        self.concurrency: int = max(concurrency, 1)
+        self.decode_workers: int = max(decode_workers, 0)
+        self.request_slots: threading.BoundedSemaphore = (
+            threading.BoundedSemaphore(self.concurrency)
+        )
+        self.transfer: TransferStats = TransferStats()
+        self.cache: PayloadCache = PayloadCache(cache_max_bytes)
         self.client: httpx.Client = httpx.Client(
             http2=True,
             headers=dict(headers),
+            limits=httpx.Limits(
+                max_keepalive_connections=self.concurrency,
+                max_connections=self.concurrency,
+            ),
         )
 
-        # Set plugin or plugins
-        if isinstance(plugins, str):
-            self.plugins = [plugins]
-        else:
-            self.plugins = plugins
-
-    def active_versions(self) -> Generator:  # noqa: WPS210
+    def active_versions(self) -> Generator:
         """Active versions.
 
         Yields:
-            Generator -- JSON
+            Generator -- Cleaned records
         """
         cleaner: Callable = CLEANERS.get('active_versions', {})
+        selected: Optional[FrozenSet[str]] = self._fields('active_versions')
 
         # For every plugin
-        for plugin in self.plugins:
-            path: str = f'{ENDPOINT_ACTIVE_VERSIONS}' .replace(
+        for plugin, response in self._fetch(
+            'active_versions',
+            lambda plugin: ENDPOINT_ACTIVE_VERSIONS.replace(
                 ':plugin:',
                 plugin,
-            )
-
-            # Load the data
-            response: dict = self._load(path)
-
-            # Transform the records
-            records: List[dict] = [
-                {
-                    'version': key,
-                    'percentage': str(percentage),
-                    'plugin': plugin,
-                } for key, percentage in response.items()
-            ]
-
-            # Yield
-            yield from (
-                cleaner(record)
-                for record in records
-            )
+            ),
+        ):
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            row: dict = {'plugin': plugin}
+            for key, percentage in response.items():
+                row['version'] = key
+                row['percentage'] = str(percentage)
+                yield cleaner(row, selected)
 
-    def active_installs(self, limit: int = 730) -> Generator:  # noqa: WPS210
+    def active_installs(self, limit: int = 730) -> Generator:
         """Active installs.
 
         Keyword Arguments:
             limit {int} -- Number of historical data days (default: {730})
 
         Yields:
-            Generator -- JSON
+            Generator -- Cleaned records
         """
         cleaner: Callable = CLEANERS.get('active_installs', {})
+        selected: Optional[FrozenSet[str]] = self._fields('active_installs')
 
         # For every plugin
-        for plugin in self.plugins:
-            path: str = f'{ENDPOINT_ACTIVE_INSTALLS}' .replace(
+        for plugin, response in self._fetch(
+            'active_installs',
+            lambda plugin: ENDPOINT_ACTIVE_INSTALLS.replace(
                 ':plugin:',
                 plugin,
             ).replace(
                 ':limit:',
                 str(limit),
-            )
-
-            # Load the data
-            response: dict = self._load(path)
-
-            # Transform the records
-            records: List[dict] = [
-                {
-                    'date': key,
-                    'percentage': str(percentage),
-                    'plugin': plugin,
-                } for key, percentage in response.items()
-            ]
-
-            # Yield
-            yield from (
-                cleaner(record)
-                for record in records
-            )
+            ),
+        ):
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            row: dict = {'plugin': plugin}
+            for key, percentage in response.items():
+                row['date'] = key
+                row['percentage'] = str(percentage)
+                yield cleaner(row, selected)
 
     def downloads(self, limit: int = 730) -> Generator:  # noqa: WPS210
         """Plugin downloads.
 
+        Plugins with a bookmark in the state are fetched from the bookmark
+        minus the overlap. The series is verified against the bookmark, the
+        window from a missing date is fetched again once a day.
+
+        The fetched series are merged into the archive if it is set. With
+        from_archive, the downloads are read from the archive instead.
+
         Keyword Arguments:
             limit {int} -- Number of historical data days (default: {730})
 
         Yields:
-            Generator -- JSON
+            Generator -- Cleaned records
         """
         cleaner: Callable = CLEANERS.get('downloads', {})
+        selected: Optional[FrozenSet[str]] = self._fields('downloads')
+
+        if self.archive and self.from_archive:
+            yield from self._archived_downloads(cleaner, selected)
+            return
+
+        archived: dict = {}
+        bookmarks: dict = self.state.setdefault(
+            'bookmarks',
+            {},
+        ).setdefault('downloads', {})
+        today: date = datetime.now(tz=timezone.utc).date()
 
         # For every plugin
-        for plugin in self.plugins:
-            path: str = f'{ENDPOINT_DOWNLOADS}' .replace(
-                ':plugin:',
+        for plugin, response in self._fetch(
+            'downloads',
+            lambda plugin: self._downloads_path(
                 plugin,
-            ).replace(
-                ':limit:',
-                str(limit),
-            )
+                window(bookmarks.get(plugin), limit, today, self.overlap),
+            ),
+        ):
+            bookmark: dict = bookmarks.get(plugin) or {}
+            revised: int = len(revised_dates(response, bookmark.get(
+                'tail',
+                {},
+            )))
+            if revised:
+                logging.info(f'Downloads of {plugin} revised {revised} days')
 
-            # Load the data
-            response: dict = self._load(path)
-
-            # Transform the records
-            records: List[dict] = [
-                {
-                    'date': key,
-                    'downloads': download,
-                    'plugin': plugin,
-                } for key, download in response.items()
-            ]
-
-            # Yield
-            yield from (
-                cleaner(record)
-                for record in records
+            # Verify the series and fetch the affected window again, bypassing
+            # the cache which holds the unverified series
+            repaired_at: Optional[str] = bookmark.get('repaired')
+            repair: int = min(
+                repair_window(response, bookmark, today, self.overlap),
+                limit,
             )
+            if repair:
+                logging.warning(
+                    f'Downloads of {plugin} have missing dates, fetching the '
+                    f'last {repair} days again',
+                )
+                repaired_at = str(today)
+                repaired, _ = self._request(
+                    self._downloads_path(plugin, repair),
+                )
+
+                # The repair window only covers the days from the oldest
+                # hole, the days before it are kept
+                response = dict(sorted({**response, **repaired}.items()))
+
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            row: dict = {'plugin': plugin}
+            for key, download in response.items():
+                row['date'] = key
+                row['downloads'] = download
+                yield cleaner(row, selected)
+
+            if response:
+                bookmarks[plugin] = downloads_bookmark(
+                    response,
+                    self.overlap,
+                    repaired_at,
+                )
+            if self.archive:
+                archived[plugin] = response
+
+        if archived:
+            update_archive(self.archive, archived)
 
     def downloads_summary(self) -> Generator:
         """Plugin downloads summary.
 
         Yields:
-            Generator -- JSON
+            Generator -- Cleaned records
         """
         cleaner: Callable = CLEANERS.get('downloads_summary', {})
+        selected: Optional[FrozenSet[str]] = self._fields('downloads_summary')
 
         # For every plugin
-        for plugin in self.plugins:
-            path: str = f'{ENDPOINT_DOWNLOADS_SUMMARY}' .replace(
+        for plugin, response in self._fetch(
+            'downloads_summary',
+            lambda plugin: ENDPOINT_DOWNLOADS_SUMMARY.replace(
                 ':plugin:',
                 plugin,
-            )
+            ),
+        ):
+            # add plugin, the response is copied because it is cached
+            row: dict = dict(response)
+            row['plugin'] = plugin
 
-            # Load the data
-            response: dict = self._load(path)
+            yield cleaner(row, selected)
 
-            # add plugin
-            response['plugin'] = plugin
-
-            yield cleaner(response)
-
-    def info(self) -> Generator:  # noqa: WPS110
+    def info(self) -> Generator:  # noqa: WPS110, WPS231
         """Plugin info.
 
+        The info is loaded for the exact slug of every plugin, with the same
+        payload as plugin_information. With a slug index, plugins that were
+        updated since the last refresh are read from the recently updated
+        plugins, and the other plugins are skipped if skip_unchanged is set.
+
         Yields:
-            Generator -- JSON
+            Generator -- Cleaned records
         """
         cleaner: Callable = CLEANERS.get('info', {})
+        selected: Optional[FrozenSet[str]] = self._fields('info')
+
+        # Plugins updated since the last refresh, None if it is not known
+        updated: Optional[Dict[str, dict]] = None
+        refreshed: str = datetime.now(tz=timezone.utc).replace(
+            microsecond=0,
+        ).isoformat()
+        if self.slug_index:
+            updated = self._refresh_slug_index()
+
+        # Indexed plugins that were not updated since the last refresh
+        unchanged: Set[str] = set()
+        if self.slug_index and self.skip_unchanged and updated is not None:
+            unchanged = {
+                plugin for plugin in self.plugins
+                if plugin not in updated and self.slug_index.get(plugin)
+            }
+
+        # Plugins done by an interrupted run
+        resumed: Set[str] = self.checkpoint.completed('info')
+
+        # For every plugin, the indexed plugins are not loaded
+        for plugin, response in self._fetch(
+            'info',
+            self._plugin_information_path,
+            local=lambda plugin: (updated or {}).get(plugin) or (
+                self.slug_index.get(plugin) if plugin in unchanged else None
+            ),
+        ):
+            if plugin in unchanged:
+                continue
+            if self.slug_index:
+                self.slug_index.update(plugin, response)
 
-        for plugin in self.plugins:
-            path: str = f'{ENDPOINT_INFO}' .replace(
+            # add plugin, the response is wrapped because it is cached
+            row: dict = {'plugin': plugin, 'plugins': [response]}
+
+            record: tuple = cleaner(row, selected)
+
+            # Releases determine the change rate of a plugin
+            if self.scheduler and 'last_updated' in record._fields:
+                self.scheduler.observe(plugin, record.last_updated)
+
+            yield record
+
+        if self.slug_index:
+            # Plugins that were deferred, or done by an interrupted run, are
+            # not in the index yet. The refresh is only advanced when every
+            # plugin was done in this run, so the next run browses their
+            # updates. Plugins that were not found are done.
+            done: Set[str] = self.checkpoint.completed('info')
+            if not resumed and done.issuperset(self.plugins):
+                self.slug_index.refreshed = refreshed
+            self.slug_index.save()
+
+    def plugin_information(self) -> Generator:
+        """Plugin information.
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        cleaner: Callable = CLEANERS.get('plugin_information', {})
+        selected: Optional[FrozenSet[str]] = self._fields('plugin_information')
+
+        # For every plugin
+        for plugin, response in self._fetch(
+            'plugin_information',
+            self._plugin_information_path,
+        ):
+            # add plugin, the response is copied because it is cached
+            row: dict = dict(response)
+            row['plugin'] = plugin
+
+            yield cleaner(row, selected)
+
+    def plugin_versions(self) -> Generator:
+        """Plugin versions.
+
+        Uses the same payload as plugin_information, which is loaded once.
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        cleaner: Callable = CLEANERS.get('plugin_versions', {})
+        selected: Optional[FrozenSet[str]] = self._fields('plugin_versions')
+
+        # For every plugin
+        for plugin, response in self._fetch(
+            'plugin_versions',
+            self._plugin_information_path,
+        ):
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            versions: dict = response.get('versions') or {}
+            row: dict = {'plugin': plugin}
+            for key, download_link in versions.items():
+                row['version'] = key
+                row['download_link'] = download_link
+                yield cleaner(row, selected)
+
+    def wordpress_versions(self) -> Generator:
+        """WordPress versions of all WordPress sites.
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        yield from self._versions(
+            'wordpress_versions',
+            ENDPOINT_WORDPRESS_VERSIONS,
+        )
+
+    def php_versions(self) -> Generator:
+        """PHP versions of all WordPress sites.
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        yield from self._versions(
+            'php_versions',
+            ENDPOINT_PHP_VERSIONS,
+        )
+
+    def downloads_weekly(self, limit: int = 730) -> Generator:
+        """Plugin downloads per week, computed from the downloads.
+
+        Keyword Arguments:
+            limit {int} -- Number of historical data days (default: {730})
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        yield from self._downloads_totals(
+            'downloads_weekly',
+            'week',
+            limit,
+            week_start,
+            next_week,
+        )
+
+    def downloads_monthly(self, limit: int = 730) -> Generator:
+        """Plugin downloads per month, computed from the downloads.
+
+        Keyword Arguments:
+            limit {int} -- Number of historical data days (default: {730})
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        yield from self._downloads_totals(
+            'downloads_monthly',
+            'month',
+            limit,
+            month_start,
+            next_month,
+        )
+
+    def active_installs_delta(self, limit: int = 730) -> Generator:
+        """Active installs and the change since the previous available day.
+
+        Days without data are skipped, the change of the day after a hole
+        spans the hole.
+
+        Keyword Arguments:
+            limit {int} -- Number of historical data days (default: {730})
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        cleaner: Callable = CLEANERS.get('active_installs_delta', {})
+        selected: Optional[FrozenSet[str]] = self._fields(
+            'active_installs_delta',
+        )
+
+        # For every plugin
+        for plugin, response in self._fetch(
+            'active_installs_delta',
+            lambda plugin: ENDPOINT_ACTIVE_INSTALLS.replace(
                 ':plugin:',
                 plugin,
+            ).replace(
+                ':limit:',
+                str(limit),
+            ),
+        ):
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            row: dict = {'plugin': plugin}
+            for key, percentage, delta in deltas(response):
+                row['date'] = key
+                row['percentage'] = percentage
+                row['delta'] = delta
+                yield cleaner(row, selected)
+
+    def _downloads_totals(  # noqa: WPS211
+        self,
+        stream: str,
+        period_key: str,
+        limit: int,
+        period_start: Callable[[date], date],
+        next_period: Callable[[date], date],
+    ) -> Generator:
+        """Plugin downloads per period.
+
+        The full downloads series is fetched, so the payload is shared with
+        the downloads stream of a run without bookmarks.
+
+        Arguments:
+            stream {str} -- Stream name
+            period_key {str} -- Key of the period in the records
+            limit {int} -- Number of historical data days
+            period_start {Callable[[date], date]} -- Returns the period of a
+                day
+            next_period {Callable[[date], date]} -- Returns the next period
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        cleaner: Callable = CLEANERS.get(stream, {})
+        selected: Optional[FrozenSet[str]] = self._fields(stream)
+
+        # For every plugin
+        for plugin, response in self._fetch(
+            stream,
+            lambda plugin: self._downloads_path(plugin, limit),
+        ):
+            # Transform the records, the input row is reused because the
+            # cleaner turns it into a compact record
+            row: dict = {'plugin': plugin}
+            for period, total, days in totals(
+                response,
+                period_start,
+                next_period,
+            ):
+                row[period_key] = str(period)
+                # As in the API payload, so 0 is not cleaned to None
+                row['downloads'] = str(total)
+                row['days'] = str(days)
+                yield cleaner(row, selected)
+
+    def _versions(self, stream: str, path: str) -> Generator:
+        """Version distribution of all WordPress sites.
+
+        Arguments:
+            stream {str} -- Stream name
+            path {str} -- Path to fetch from
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        cleaner: Callable = CLEANERS.get(stream, {})
+        selected: Optional[FrozenSet[str]] = self._fields(stream)
+
+        if self.controller and not self.controller.admitted(stream):
+            return
+
+        response: dict = self._load(path)
+
+        # Transform the records, the input row is reused because the
+        # cleaner turns it into a compact record
+        row: dict = {}
+        for key, percentage in response.items():
+            row['version'] = key
+            row['percentage'] = str(percentage)
+            yield cleaner(row, selected)
+
+    def _archived_downloads(
+        self,
+        cleaner: Callable,
+        selected: Optional[FrozenSet[str]],
+    ) -> Generator:
+        """Plugin downloads from the archive.
+
+        Arguments:
+            cleaner {Callable} -- Cleaner of the stream
+            selected {Optional[FrozenSet[str]]} -- Selected fields, None for
+                all fields
+
+        Yields:
+            Generator -- Cleaned records
+        """
+        with SeriesArchive(self.archive) as archive:
+            for plugin in self.plugins:
+                # Transform the records, the input row is reused because the
+                # cleaner turns it into a compact record
+                row: dict = {'plugin': plugin}
+                for key, download in archive.items(plugin):
+                    row['date'] = key
+                    # As in the API payload, so 0 is not cleaned to None
+                    row['downloads'] = str(download)
+                    yield cleaner(row, selected)
+
+    def _fields(self, stream: str) -> Optional[FrozenSet[str]]:
+        """Return the selected fields of a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+
+        Returns:
+            Optional[FrozenSet[str]] -- Selected fields, None for all fields
+        """
+        if self.selection is None:
+            return None
+        return self.selection.get(stream)
+
+    def _mapping(self, stream: str) -> dict:
+        """Return the mapping of the selected fields of a stream.
+
+        Arguments:
+            stream {str} -- Stream name
+
+        Returns:
+            dict -- Selected part of the stream mapping
+        """
+        selected: Optional[FrozenSet[str]] = self._fields(stream)
+
+        return {
+            key: key_mapping
+            for key, key_mapping in STREAMS[stream].get('mapping', {}).items()
+            if selected is None or (key_mapping.get('map') or key) in selected
+        }
+
+    def _plugin_information_path(self, plugin: str) -> str:
+        """Return the plugin information path of a plugin.
+
+        The path requests the fields of info, plugin_information and
+        plugin_versions if they are selected, so the streams share the
+        payload.
+
+        Arguments:
+            plugin {str} -- Plugin
+
+        Returns:
+            str -- Path
+        """
+        return ENDPOINT_PLUGIN_INFORMATION.replace(
+            ':plugin:',
+            plugin,
+        ) + info_fields(
+            *[
+                self._mapping(stream)
+                for stream in ('info', 'plugin_information', 'plugin_versions')
+                if self.selection is None or stream in self.selection
+            ],
+            INDEX_MAPPING if self.slug_index else {},
+        )
+
+    def _refresh_slug_index(self) -> Optional[Dict[str, dict]]:
+        """Find the plugins that were updated since the last refresh.
+
+        The recently updated plugins are browsed, newest first, until the
+        last refresh. The metadata of the plugins in the browsed pages is
+        the same as for their exact slug.
+
+        Returns:
+            Optional[Dict[str, dict]] -- Metadata of the updated plugins, None
+                if the index was never refreshed or not all updates were
+                browsed
+        """
+        previous: Optional[str] = self.slug_index.refreshed  # type: ignore
+
+        # Without a previous refresh, every plugin is loaded by slug
+        if previous is None:
+            return None
+
+        since: datetime = datetime.fromisoformat(previous) - INDEX_OVERLAP
+        tracked: Set[str] = set(self.plugins)
+        updated: Dict[str, dict] = {}
+        fields: str = info_fields(self._mapping('info'), INDEX_MAPPING)
+
+        for page in range(1, INDEX_MAX_PAGES + 1):
+            if self.controller and self.controller.limit():
+                break
+
+            response, _ = self._request(
+                ENDPOINT_INFO_UPDATED.replace(
+                    ':per_page:',
+                    str(INDEX_PAGE_SIZE),
+                ).replace(
+                    ':page:',
+                    str(page),
+                ) + fields,
             )
-            response: dict = self._load(path)
 
-            # add plugin
-            response['plugin'] = plugin
+            for plugin_data in response.get('plugins', []):
+                plugin_updated: Optional[datetime] = updated_at(plugin_data)
+                if plugin_updated is not None and plugin_updated < since:
+                    return updated
+                if plugin_data.get('slug') in tracked:
+                    updated[plugin_data['slug']] = plugin_data
+
+            if page >= response.get('info', {}).get('pages', 0):
+                return updated
+
+        logging.warning(
+            'Not all updated plugins were browsed, loading the info of every '
+            'plugin by slug',
+        )
+        return None
+
+    def _downloads_path(self, plugin: str, limit: int) -> str:
+        """Return the downloads path of a plugin.
+
+        Arguments:
+            plugin {str} -- Plugin
+            limit {int} -- Number of historical data days
+
+        Returns:
+            str -- Path
+        """
+        return ENDPOINT_DOWNLOADS.replace(
+            ':plugin:',
+            plugin,
+        ).replace(
+            ':limit:',
+            str(limit),
+        )
+
+    def _fetch(  # noqa: WPS231
+        self,
+        stream: str,
+        build_path: Callable[[str], str],
+        local: Optional[Callable[[str], Optional[dict]]] = None,
+    ) -> Generator:
+        """Load a path for every plugin.
+
+        Up to self.concurrency paths are requested at the same time, and up
+        to self.decode_workers more responses are decoded meanwhile. The
+        responses are yielded in the order of the plugins, or in the order of
+        the scheduler if it is set. Plugins that are done for the stream in
+        an interrupted run are skipped, and no more plugins are loaded when a
+        limit of the controller is near.
+
+        Arguments:
+            stream {str} -- Stream name
+            build_path {Callable[[str], str]} -- Returns the path of a plugin
+
+        Keyword Arguments:
+            local {Optional[Callable[[str], Optional[dict]]]} -- Returns the
+                JSON of a plugin that is known locally, which is not loaded
+                (default: {None})
+
+        Yields:
+            Generator -- Tuple of plugin and JSON as dict
+        """
+        completed: Set[str] = self.checkpoint.completed(stream)
+        remaining: List[str] = [
+            plugin for plugin in self.plugins if plugin not in completed
+        ]
+
+        plugins: Iterator[str] = iter(remaining)
+        if self.scheduler:
+            plugins = self.scheduler.plugins(stream, remaining)
+        if self.controller:
+            plugins = self.controller.admit(stream, plugins)
+
+        # Responses are only cached for the streams that read them later
+        readers: int = self._readers(stream)
+
+        workers: int = self.concurrency + self.decode_workers
+        if workers == 1:
+            for plugin in plugins:
+                payload: Optional[dict] = self._payload(
+                    plugin,
+                    build_path,
+                    local,
+                    readers,
+                )
+                if payload is not None:
+                    yield plugin, payload
+                self._done(stream, plugin)
+            return
+
+        pending: Deque[Tuple[str, Future]] = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for plugin in plugins:
+                pending.append((
+                    plugin,
+                    executor.submit(
+                        self._payload,
+                        plugin,
+                        build_path,
+                        local,
+                        readers,
+                    ),
+                ))
+
+                # Yield the oldest response when the window is full
+                if len(pending) >= workers:
+                    done_plugin, future = pending.popleft()
+                    if future.result() is not None:
+                        yield done_plugin, future.result()
+                    self._done(stream, done_plugin)
+
+            # Yield the remaining responses
+            while pending:
+                done_plugin, future = pending.popleft()
+                if future.result() is not None:
+                    yield done_plugin, future.result()
+                self._done(stream, done_plugin)
+
+    def _readers(self, stream: str) -> int:
+        """Return the number of later streams that read the same payloads.
+
+        Streams are synced in the order of the selection, a payload is read
+        by the selected streams after the stream with the same 'payload' in
+        STREAMS. Without a selection, no later reads are known.
+
+        Arguments:
+            stream {str} -- Stream name
+
+        Returns:
+            int -- Number of later streams
+        """
+        payload: Optional[str] = STREAMS[stream].get('payload')
+        if payload is None or self.selection is None:
+            return 0
+
+        streams: List[str] = list(self.selection)
+        if stream not in streams:
+            return 0
+        return sum(
+            STREAMS[later].get('payload') == payload
+            for later in streams[streams.index(stream) + 1:]
+        )
+
+    def _done(self, stream: str, plugin: str) -> None:
+        """Mark a plugin as synced for a stream.
 
-            yield cleaner(response)
+        Arguments:
+            stream {str} -- Stream name
+            plugin {str} -- Plugin
+        """
+        if self.scheduler:
+            self.scheduler.done(stream, plugin)
+        self.checkpoint.done(stream, plugin)
 
-    def _load(self, path: str) -> dict:
+    def _payload(
+        self,
+        plugin: str,
+        build_path: Callable[[str], str],
+        local: Optional[Callable[[str], Optional[dict]]],
+        readers: int,
+    ) -> Optional[dict]:
+        """Return the JSON of a plugin, loaded if it is not known locally.
+
+        Arguments:
+            plugin {str} -- Plugin
+            build_path {Callable[[str], str]} -- Returns the path of a plugin
+            local {Optional[Callable[[str], Optional[dict]]]} -- Returns the
+                JSON of a plugin that is known locally
+            readers {int} -- Number of later reads of the JSON
+
+        Returns:
+            Optional[dict] -- JSON as dict, None if the plugin is not found
+        """
+        if local:
+            payload: Optional[dict] = local(plugin)
+            if payload is not None:
+                return payload
+
+        # An unknown or closed plugin is skipped, not the whole sync
+        try:
+            return self._load(build_path(plugin), readers)
+        except PluginNotFoundException:
+            logging.warning(f'Plugin {plugin} was not found, skipping it')
+            return None
+
+    def _load(self, path: str, readers: int = 0) -> dict:
         """Load an URL and return JSON.
 
+        The JSON is cached until its later reads, so it must not be mutated.
+
         Arguments:
             path {str} -- Path to fetch from
 
+        Keyword Arguments:
+            readers {int} -- Number of later reads of the JSON
+                (default: {0})
+
         Returns:
             dict -- JSON as dict
         """
-        url: str = f'{API_BASE_PATH}{path}'
+        return self.cache.get(path, lambda: self._request(path), readers)
+
+    def _request(self, path: str) -> Tuple[dict, int]:
+        """Request an URL.
+
+        The body is received as it is encoded on the wire, and decoded after
+        the request slot is released, so other requests are made while it is
+        decoded.
+
+        Arguments:
+            path {str} -- Path to fetch from
+
+        Raises:
+            PluginNotFoundException: The API does not know the path
+
+        Returns:
+            Tuple[dict, int] -- JSON as dict and the decoded size of the
+                response
+        """
+        url: str = f'{self.api_base_url}{path}'
         logging.info(f'Loading: {url}')
-        response: httpx._models.Response = self.client.get(  # noqa: WPS437
-            url,
-        )
+
+        with self.request_slots:
+            start: float = time.perf_counter()
+            with self.client.stream('GET', url) as response:
+                body: bytes = b''.join(response.iter_raw())
+
+            # Count the request against the limits of the run
+            if self.controller:
+                self.controller.record(
+                    len(body),
+                    time.perf_counter() - start,
+                )
+        if response.status_code == httpx.codes.NOT_FOUND:
+            raise PluginNotFoundException(f'Not found: {url}')
         response.raise_for_status()
 
-        return response.json()
+        return self.transfer.parse(
+            body,
+            response.headers.get('Content-Encoding', ''),
+        )
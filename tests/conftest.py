@@ -0,0 +1,48 @@
+"""Fixtures of the tests."""
+# -*- coding: utf-8 -*-
+from typing import Callable, List, Tuple
+
+import pytest
+
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+# Creates a stubbed client from a response function, the plugins and the
+# other arguments of the client
+StubClient = Callable[..., Tuple[WordPressPluginStats, List[str]]]
+
+
+@pytest.fixture
+def stub_client() -> StubClient:
+    """Return a factory of clients of which the requests are stubbed.
+
+    The requests run in the main thread, return the JSON of the response
+    function and count against the limits of the controller of the client.
+
+    Returns:
+        StubClient -- Creates a client and the list of its requested paths
+    """
+    def create(  # noqa: WPS430
+        respond: Callable[[str], dict],
+        plugins: Tuple[str, ...] = ('plugin',),
+        **kwargs: dict,
+    ) -> Tuple[WordPressPluginStats, List[str]]:
+        wp: WordPressPluginStats = WordPressPluginStats(
+            list(plugins),
+            decode_workers=0,
+            **kwargs,
+        )
+        paths: List[str] = []
+
+        def request(path: str) -> Tuple[dict, int]:  # noqa: WPS430
+            if wp.controller:
+                wp.controller.record(0, 0)
+            response: dict = respond(path)
+            paths.append(path)
+            return response, 0
+
+        wp._request = request  # type: ignore  # noqa: WPS437
+        return wp, paths
+
+    return create
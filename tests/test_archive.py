@@ -0,0 +1,126 @@
+"""Tests of the downloads archive."""
+# -*- coding: utf-8 -*-
+import os
+from datetime import date, timedelta
+
+from tap_wordpress_plugin_stats.archive import (  # noqa: I001
+    SLACK_DAYS,  # noqa: I001
+    SeriesArchive,  # noqa: I001
+    update_archive,  # noqa: I001
+    write_archive,  # noqa: I001
+)  # noqa: I001
+
+FIRST_DAY: date = date(2021, 1, 1)
+
+
+def series(first: int, last: int, offset: int = 0) -> dict:
+    """Create a series of date: value.
+
+    Arguments:
+        first {int} -- First day after FIRST_DAY
+        last {int} -- Last day after FIRST_DAY, inclusive
+
+    Keyword Arguments:
+        offset {int} -- Added to the values (default: {0})
+
+    Returns:
+        dict -- Series of date: value
+    """
+    return {
+        str(FIRST_DAY + timedelta(days=day)): str(day + offset)
+        for day in range(first, last + 1)
+    }
+
+
+def archived(path: str, slug: str) -> dict:
+    """Read a series from an archive.
+
+    Arguments:
+        path {str} -- Archive path
+        slug {str} -- Plugin
+
+    Returns:
+        dict -- Series of date: value
+    """
+    with SeriesArchive(path) as archive:
+        return archive.to_dict(slug)
+
+
+def expected(input_series: dict) -> dict:
+    """Convert a series to archived values.
+
+    Arguments:
+        input_series {dict} -- Series of date: value
+
+    Returns:
+        dict -- Series of date: int
+    """
+    return {day: int(input_value) for day, input_value in input_series.items()}
+
+
+def test_update_in_place(tmp_path: str) -> None:
+    """Daily updates are written in place, without growing the file."""
+    path: str = os.path.join(tmp_path, 'downloads.wpsa')
+    write_archive(path, {'a': series(0, 99), 'b': series(0, 99)})
+    size: int = os.path.getsize(path)
+
+    update_archive(path, {'a': series(95, 100, offset=1)})
+
+    assert archived(path, 'a') == expected({
+        **series(0, 94),
+        **series(95, 100, offset=1),
+    })
+    assert archived(path, 'b') == expected(series(0, 99))
+    # Only a new index is appended
+    assert os.path.getsize(path) - size < 100
+
+
+def test_update_relocates_series(tmp_path: str) -> None:
+    """Series that do not fit are appended with their archived values."""
+    path: str = os.path.join(tmp_path, 'downloads.wpsa')
+    write_archive(path, {'a': series(10, 19)})
+
+    late: dict = series(20 + SLACK_DAYS, 20 + SLACK_DAYS)
+    update_archive(path, {'a': {**series(5, 5), **late}, 'b': series(0, 1)})
+
+    assert archived(path, 'a') == expected({
+        **series(5, 5),
+        **series(10, 19),
+        **late,
+    })
+    assert archived(path, 'b') == expected(series(0, 1))
+
+
+def test_update_keeps_archived_days_in_holes(tmp_path: str) -> None:
+    """Days missing from an update keep their archived values."""
+    path: str = os.path.join(tmp_path, 'downloads.wpsa')
+    write_archive(path, {'a': series(0, 9)})
+
+    update: dict = series(3, 6, offset=100)
+    update.pop(str(FIRST_DAY + timedelta(days=4)))
+    update_archive(path, {'a': update})
+
+    assert archived(path, 'a') == expected({**series(0, 9), **update})
+
+
+def test_update_compacts(tmp_path: str) -> None:
+    """The archive is rewritten when most of the file is unused."""
+    path: str = os.path.join(tmp_path, 'downloads.wpsa')
+    write_archive(path, {'a': series(0, 9)})
+
+    for step in range(1, 6):
+        update_archive(path, {'a': series(step * 400, step * 400)})
+
+    with SeriesArchive(path) as archive:
+        assert archive.live_bytes() * 2 >= os.path.getsize(path)
+        assert archive.to_dict('a') == expected({
+            **series(0, 9),
+            **{
+                day: input_value
+                for step in range(1, 6)
+                for day, input_value in series(
+                    step * 400,
+                    step * 400,
+                ).items()
+            },
+        })
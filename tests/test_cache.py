@@ -0,0 +1,117 @@
+"""Tests of the payload cache."""
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+from conftest import StubClient
+
+from tap_wordpress_plugin_stats.cache import MEMORY_PER_BYTE, PayloadCache
+
+
+def loader(
+    payload: dict,
+    size: int = 10,
+) -> Tuple[Callable[[], Tuple[dict, int]], List[int]]:
+    """Create a load function that counts its calls.
+
+    Arguments:
+        payload {dict} -- Loaded payload
+
+    Keyword Arguments:
+        size {int} -- Size in bytes of the text (default: {10})
+
+    Returns:
+        Tuple[Callable[[], Tuple[dict, int]], List[int]] -- Load function and
+            its calls
+    """
+    calls: List[int] = []
+
+    def load() -> Tuple[dict, int]:  # noqa: WPS430
+        calls.append(1)
+        return payload, size
+
+    return load, calls
+
+
+def test_concurrent_reads_are_coalesced() -> None:
+    """A key that is being loaded is loaded once for all readers."""
+    cache: PayloadCache = PayloadCache()
+    started: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+    calls: List[int] = []
+
+    def load() -> Tuple[dict, int]:  # noqa: WPS430
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {'a': 1}, 10
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get, 'path', load, 1)
+        started.wait()
+        second = executor.submit(cache.get, 'path', load, 1)
+        while not cache.stats()['coalesced']:
+            threading.Event().wait(0.001)
+        release.set()
+
+        assert first.result() == second.result() == {'a': 1}
+
+    assert len(calls) == 1
+    # The waiting reader was the expected later read
+    assert cache.stats()['entries'] == 0
+
+
+def test_payloads_are_kept_for_their_readers() -> None:
+    """A payload is only kept until its last expected read."""
+    cache: PayloadCache = PayloadCache()
+    load, calls = loader({'a': 1})
+
+    cache.get('unshared', load)
+    assert cache.stats()['entries'] == 0
+
+    cache.get('shared', load, 2)
+    cache.get('shared', load)
+    assert cache.stats()['entries'] == 1
+    cache.get('shared', load)
+
+    assert cache.stats()['entries'] == 0
+    assert cache.stats()['size'] == 0
+    assert len(calls) == 2
+
+
+def test_cap_counts_decoded_memory() -> None:
+    """The least recently used payloads are evicted by their memory."""
+    cache: PayloadCache = PayloadCache(max_bytes=25 * MEMORY_PER_BYTE)
+    load, calls = loader({'a': 1})
+
+    for key in ('first', 'second', 'third'):
+        cache.get(key, load, 1)
+
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 20 * MEMORY_PER_BYTE
+
+    # The evicted payload is loaded again
+    cache.get('first', load)
+    assert len(calls) == 4
+
+
+def test_streams_share_payloads_once(stub_client: StubClient) -> None:
+    """Payloads are only cached for the later streams that read them."""
+    wp, paths = stub_client(
+        lambda path: {'slug': 'plugin', 'name': 'plugin'},
+        plugins=('first', 'second'),
+    )
+    wp.selection = {
+        'info': None,
+        'downloads': None,
+        'plugin_versions': None,
+    }
+
+    list(wp.info())
+    assert wp.cache.stats()['entries'] == 2
+    list(wp.plugin_versions())
+
+    assert len(paths) == 2
+    assert wp.cache.stats()['entries'] == 0
@@ -0,0 +1,95 @@
+"""Tests of the state checkpoints."""
+# -*- coding: utf-8 -*-
+import json
+from typing import List
+
+import pytest
+import singer
+
+from tap_wordpress_plugin_stats.checkpoint import CheckpointPolicy
+
+PLUGINS: List[str] = [f'plugin-{index}' for index in range(100)]
+
+
+def capture(monkeypatch: pytest.MonkeyPatch) -> List[dict]:
+    """Capture the written states.
+
+    Arguments:
+        monkeypatch {pytest.MonkeyPatch} -- Monkeypatch fixture
+
+    Returns:
+        List[dict] -- Written states, as JSON round trips
+    """
+    states: List[dict] = []
+    monkeypatch.setattr(
+        singer,
+        'write_state',
+        lambda state: states.append(json.loads(json.dumps(state))),
+    )
+    return states
+
+
+def test_plugin_checkpoints_are_compact(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Checkpoints within a stream leave out the scheduler data."""
+    states: List[dict] = capture(monkeypatch)
+    state: dict = {'scheduler': {'synced': {'info': {
+        plugin: '2021-01-01T00:00:00+00:00' for plugin in PLUGINS
+    }}}}
+    checkpoint: CheckpointPolicy = CheckpointPolicy(
+        state,
+        plugins=PLUGINS,
+        plugin_boundaries=True,
+    )
+
+    checkpoint.start('info')
+    for plugin in PLUGINS:
+        checkpoint.done('info', plugin)
+    checkpoint.flush()
+
+    assert len(states) == len(PLUGINS) + 1
+    assert all('scheduler' not in written for written in states[:-1])
+    assert 'scheduler' in states[-1]
+
+    # The done plugins do not grow the state
+    sizes: List[int] = [len(json.dumps(written)) for written in states[:-1]]
+    assert max(sizes) == min(sizes)
+
+
+def test_resume_skips_done_plugins(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A resumed run skips the plugins that were done."""
+    states: List[dict] = capture(monkeypatch)
+    checkpoint: CheckpointPolicy = CheckpointPolicy({}, plugins=PLUGINS)
+    checkpoint.start('info')
+    for plugin in PLUGINS[:10]:
+        checkpoint.done('info', plugin)
+    checkpoint.flush(full=False)
+
+    resumed: CheckpointPolicy = CheckpointPolicy(states[-1], plugins=PLUGINS)
+    assert resumed.completed('info') == set(PLUGINS[:10])
+    assert resumed.completed('downloads') == set()
+
+    # Done plugins of another list of plugins are not resumed
+    other: CheckpointPolicy = CheckpointPolicy(
+        states[-1],
+        plugins=PLUGINS[1:],
+    )
+    assert other.completed('info') == set()
+
+
+def test_full_state_after_partial_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The end of a stream writes the full state after a partial state."""
+    states: List[dict] = capture(monkeypatch)
+    checkpoint: CheckpointPolicy = CheckpointPolicy(
+        {'scheduler': {}},
+        plugins=PLUGINS,
+    )
+    checkpoint.start('info')
+    checkpoint.flush(full=False)
+    checkpoint.flush()
+    checkpoint.flush()
+
+    assert ['scheduler' in written for written in states] == [False, True]
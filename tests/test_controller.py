@@ -0,0 +1,56 @@
+"""Tests of the run limits."""
+# -*- coding: utf-8 -*-
+from typing import List, Tuple
+
+from conftest import StubClient
+
+from tap_wordpress_plugin_stats.controller import RunController
+from tap_wordpress_plugin_stats.scheduler import PluginScheduler
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+PLUGINS: List[str] = ['first', 'second', 'third', 'fourth']
+
+# The first plugins have the highest priority in every run
+WEIGHTS: dict = {'first': 100, 'second': 100}
+
+
+def limited_run(
+    stub_client: StubClient,
+    state: dict,
+) -> Tuple[WordPressPluginStats, List[str]]:
+    """Sync the active versions of the plugins with two requests.
+
+    Arguments:
+        stub_client {StubClient} -- Stubbed client fixture
+        state {dict} -- Singer state
+
+    Returns:
+        Tuple[WordPressPluginStats, List[str]] -- Client and the synced
+            plugins
+    """
+    wp, _ = stub_client(
+        lambda path: {'1.0': 100},
+        plugins=tuple(PLUGINS),
+        state=state,
+    )
+    wp.scheduler = PluginScheduler(wp.state, weights=WEIGHTS)
+    wp.controller = RunController(wp.state, max_requests=2)
+
+    synced: List[str] = [record.plugin for record in wp.active_versions()]
+    wp.controller.finish()
+    return wp, synced
+
+
+def test_deferred_plugins_come_first(stub_client: StubClient) -> None:
+    """The plugins deferred by a run are synced first by the next run."""
+    state: dict = {}
+
+    _, synced = limited_run(stub_client, state)
+    assert synced == ['first', 'second']
+    assert state['deferred'] == {'active_versions': ['third', 'fourth']}
+
+    _, synced = limited_run(stub_client, state)
+    assert synced == ['third', 'fourth']
+    assert set(state['deferred']['active_versions']) == {'first', 'second'}
@@ -0,0 +1,39 @@
+"""Tests of the daemon."""
+# -*- coding: utf-8 -*-
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from tap_wordpress_plugin_stats.daemon import tick_output
+
+STARTED: datetime = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def test_ticks_do_not_replace_outputs(tmp_path: str) -> None:
+    """Ticks that start at the same time write to their own files."""
+    config: dict = {'daemon_output_dir': str(tmp_path)}
+
+    for tick in ('first', 'second'):
+        with tick_output(config, STARTED) as output:
+            output.write(f'{tick}\n')
+
+    outputs: list = sorted(os.listdir(tmp_path))
+    assert outputs == [
+        '20210101T000000.000000-1.jsonl',
+        '20210101T000000.000000.jsonl',
+    ]
+    with open(os.path.join(tmp_path, outputs[1])) as first_output:
+        assert first_output.read() == 'first\n'
+
+
+def test_failed_tick_is_kept_apart(tmp_path: str) -> None:
+    """The output of a failed tick is renamed, not published."""
+    config: dict = {'daemon_output_dir': str(tmp_path)}
+
+    with pytest.raises(RuntimeError):
+        with tick_output(config, STARTED) as output:
+            output.write('partial\n')
+            raise RuntimeError('tick failed')
+
+    assert os.listdir(tmp_path) == ['20210101T000000.000000.jsonl.failed']
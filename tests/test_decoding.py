@@ -0,0 +1,84 @@
+"""Tests of the response decoding."""
+# -*- coding: utf-8 -*-
+import gzip
+import zlib
+
+import pytest
+
+from tap_wordpress_plugin_stats.decoding import (  # noqa: I001
+    ACCEPT_ENCODING,  # noqa: I001
+    DecodingError,  # noqa: I001
+    TransferStats,  # noqa: I001
+    decode,  # noqa: I001
+)  # noqa: I001
+
+BODY: bytes = b'{"2021-01-01": "10", "2021-01-02": "12"}' * 10
+
+
+def raw_deflate(body: bytes) -> bytes:
+    """Compress a body with deflate without the zlib wrapper.
+
+    Arguments:
+        body {bytes} -- Body
+
+    Returns:
+        bytes -- Compressed body
+    """
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+@pytest.mark.parametrize('content_encoding, encoded', [
+    ('', BODY),
+    ('identity', BODY),
+    ('gzip', gzip.compress(BODY)),
+    ('GZIP', gzip.compress(BODY)),
+    ('deflate', zlib.compress(BODY)),
+    ('deflate', raw_deflate(BODY)),
+    ('gzip, deflate', zlib.compress(gzip.compress(BODY))),
+])
+def test_builtin_encodings(content_encoding: str, encoded: bytes) -> None:
+    """Gzip and deflate bodies are decoded, in the order they were applied."""
+    assert decode(encoded, content_encoding) == BODY
+
+
+def test_brotli() -> None:
+    """Brotli bodies are decoded when brotli is installed."""
+    brotli = pytest.importorskip('brotli')
+
+    assert 'br' in ACCEPT_ENCODING
+    assert decode(brotli.compress(BODY), 'br') == BODY
+
+
+def test_zstandard() -> None:
+    """Zstandard bodies are decoded, also without the content size."""
+    zstandard = pytest.importorskip('zstandard')
+    compressor = zstandard.ZstdCompressor(write_content_size=False)
+
+    assert 'zstd' in ACCEPT_ENCODING
+    assert decode(compressor.compress(BODY), 'zstd') == BODY
+
+
+def test_unknown_encoding_is_rejected() -> None:
+    """An encoding that was not accepted raises an error."""
+    with pytest.raises(DecodingError, match='Unsupported'):
+        decode(BODY, 'compress')
+
+
+def test_corrupt_body_is_rejected() -> None:
+    """A body that does not match its encoding raises an error."""
+    with pytest.raises(DecodingError, match='Invalid gzip'):
+        decode(b'not gzip', 'gzip')
+
+
+def test_transfer_stats() -> None:
+    """Parsed responses are counted on the wire and decoded."""
+    transfer: TransferStats = TransferStats()
+    encoded: bytes = gzip.compress(b'{"a": 1}')
+
+    payload, size = transfer.parse(encoded, 'gzip')
+
+    assert payload == {'a': 1}
+    assert size == len(b'{"a": 1}')
+    assert transfer.stats()['wire_bytes'] == len(encoded)
+    assert transfer.stats()['encodings'] == {'gzip': 1}
@@ -0,0 +1,180 @@
+"""Tests of the downloads stream."""
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from conftest import StubClient
+
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+
+def today() -> date:
+    """Return the current date of the tap.
+
+    Returns:
+        date -- Current UTC date
+    """
+    return datetime.now(tz=timezone.utc).date()
+
+
+def series(days: int, missing: Optional[date] = None) -> dict:
+    """Create a downloads series of the last days.
+
+    Arguments:
+        days {int} -- Number of days, up to today
+
+    Keyword Arguments:
+        missing {Optional[date]} -- Date left out (default: {None})
+
+    Returns:
+        dict -- Series of date: downloads
+    """
+    first: date = today() - timedelta(days=days - 1)
+    return {
+        str(first + timedelta(days=day)): str(100 + day)
+        for day in range(days)
+        if first + timedelta(days=day) != missing
+    }
+
+
+def downloads_client(
+    stub_client: StubClient,
+    responses: List[Callable[[int], dict]],
+    state: Optional[dict] = None,
+) -> Tuple[WordPressPluginStats, List[int]]:
+    """Create a client of which the requests return the given responses.
+
+    Arguments:
+        stub_client {StubClient} -- Stubbed client fixture
+        responses {List[Callable[[int], dict]]} -- Series per request, by the
+            requested number of days
+
+    Keyword Arguments:
+        state {Optional[dict]} -- Singer state (default: {None})
+
+    Returns:
+        Tuple[WordPressPluginStats, List[int]] -- Client and the requested
+            number of days of every request
+    """
+    requested: List[int] = []
+
+    def respond(path: str) -> dict:  # noqa: WPS430
+        requested.append(int(parse_qs(urlsplit(path).query)['limit'][0]))
+        return responses[len(requested) - 1](requested[-1])
+
+    wp, _ = stub_client(respond, state=state)
+    return wp, requested
+
+
+def bookmark(days_ago: int, **extra: dict) -> dict:
+    """Create the state with a downloads bookmark of the plugin.
+
+    Arguments:
+        days_ago {int} -- Days between the bookmark and today
+
+    Keyword Arguments:
+        extra {dict} -- Other keys of the bookmark
+
+    Returns:
+        dict -- Singer state
+    """
+    return {'bookmarks': {'downloads': {'plugin': {
+        'date': str(today() - timedelta(days=days_ago)),
+        **extra,
+    }}}}
+
+
+def test_repair_keeps_days_before_hole(stub_client: StubClient) -> None:
+    """A hole is repaired without losing the days before it."""
+    hole: date = today() - timedelta(days=5)
+    wp, requested = downloads_client(
+        stub_client,
+        [lambda limit: series(limit, missing=hole), series],
+        state=bookmark(10),
+    )
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [18, 6]
+    assert [record.date for record in records] == sorted(series(18))
+    assert wp.state['bookmarks']['downloads']['plugin']['date'] == str(
+        today(),
+    )
+    assert wp.state['bookmarks']['downloads']['plugin']['repaired'] == str(
+        today(),
+    )
+
+
+def test_hole_is_repaired_once_a_day(stub_client: StubClient) -> None:
+    """A hole that was repaired today is not fetched again."""
+    hole: date = today() - timedelta(days=5)
+    wp, requested = downloads_client(
+        stub_client,
+        [lambda limit: series(limit, missing=hole)],
+        state=bookmark(10, repaired=str(today())),
+    )
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [18]
+    assert len(records) == 17
+
+
+def test_series_without_bookmark_is_not_repaired(
+    stub_client: StubClient,
+) -> None:
+    """The full history of a new plugin is not verified."""
+    hole: date = today() - timedelta(days=20)
+    wp, requested = downloads_client(
+        stub_client,
+        [lambda limit: series(limit, missing=hole)],
+    )
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [30]
+    assert len(records) == 29
+
+
+def test_old_bookmark_is_verified_within_the_fetched_days(
+    stub_client: StubClient,
+) -> None:
+    """A bookmark older than the limit does not make the series a hole."""
+    wp, requested = downloads_client(
+        stub_client,
+        [series],
+        state=bookmark(100),
+    )
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [30]
+    assert len(records) == 30
+
+
+def test_revisions_are_not_fetched_again(stub_client: StubClient) -> None:
+    """Revised values are emitted from the fetched series."""
+    revised: str = str(today() - timedelta(days=3))
+    wp, requested = downloads_client(
+        stub_client,
+        [series],
+        state=bookmark(3, tail={revised: 1}),
+    )
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [11]
+    assert len(records) == 11
+
+
+def test_complete_series_is_not_fetched_again(stub_client: StubClient) -> None:
+    """A complete series is emitted as fetched."""
+    wp, requested = downloads_client(stub_client, [series])
+
+    records: list = list(wp.downloads(limit=30))
+
+    assert requested == [30]
+    assert len(records) == 30
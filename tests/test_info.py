@@ -0,0 +1,123 @@
+"""Tests of the info stream."""
+# -*- coding: utf-8 -*-
+import os
+from typing import Callable, List, Optional
+
+import httpx
+from conftest import StubClient
+
+from tap_wordpress_plugin_stats.controller import RunController
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+
+def slug_response(path: str) -> dict:
+    """Return the information of the requested plugin.
+
+    Arguments:
+        path {str} -- Requested path
+
+    Returns:
+        dict -- Slug and name of the plugin
+    """
+    slug: str = path.split('slug]=')[1].split('&')[0]
+    return {'slug': slug, 'name': slug}
+
+
+def indexed_client(
+    stub_client: StubClient,
+    index: str,
+    max_requests: Optional[int] = None,
+) -> WordPressPluginStats:
+    """Create a client with a slug index of which the requests are stubbed.
+
+    Arguments:
+        stub_client {StubClient} -- Stubbed client fixture
+        index {str} -- Path of the slug index
+
+    Keyword Arguments:
+        max_requests {Optional[int]} -- Maximum number of requests
+            (default: {None})
+
+    Returns:
+        WordPressPluginStats -- Client
+    """
+    wp, _ = stub_client(
+        slug_response,
+        plugins=('first', 'second'),
+        slug_index=index,
+    )
+    wp.controller = RunController(wp.state, max_requests=max_requests)
+    return wp
+
+
+def test_deferred_plugins_keep_refresh(
+    stub_client: StubClient,
+    tmp_path: str,
+) -> None:
+    """The refresh is not advanced while plugins are deferred."""
+    index: str = os.path.join(tmp_path, 'index.json')
+    wp: WordPressPluginStats = indexed_client(
+        stub_client,
+        index,
+        max_requests=1,
+    )
+
+    records: List[tuple] = list(wp.info())
+
+    assert [record.plugin for record in records] == ['first']
+    assert wp.slug_index.refreshed is None  # type: ignore
+    assert set(wp.slug_index.plugins) == {'first'}  # type: ignore
+
+    wp = indexed_client(stub_client, index)
+    records = list(wp.info())
+
+    assert [record.plugin for record in records] == ['first', 'second']
+    assert wp.slug_index.refreshed is not None  # type: ignore
+
+
+def test_unknown_plugin_is_skipped() -> None:
+    """A plugin that is not found is skipped and marked as done."""
+    wp: WordPressPluginStats = WordPressPluginStats(
+        ['first', 'closed'],
+        decode_workers=0,
+    )
+
+    def respond(request: httpx.Request) -> httpx.Response:  # noqa: WPS430
+        if 'closed' in str(request.url):
+            return httpx.Response(404, json={'error': 'Plugin not found.'})
+        return httpx.Response(200, json={'slug': 'first', 'name': 'first'})
+
+    wp.client = httpx.Client(transport=httpx.MockTransport(respond))
+
+    records: List[tuple] = list(wp.info())
+
+    assert [record.plugin for record in records] == ['first']
+    assert wp.checkpoint.completed('info') == {'first', 'closed'}
+
+
+def test_index_keeps_only_info_keys(
+    stub_client: StubClient,
+    tmp_path: str,
+) -> None:
+    """The heavy keys of the payload are not indexed."""
+    index: str = os.path.join(tmp_path, 'index.json')
+    wp: WordPressPluginStats = indexed_client(stub_client, index)
+    wp.selection = {'info': None, 'plugin_versions': None}
+    request: Callable = wp._request  # type: ignore  # noqa: WPS437
+
+    def heavy_request(path: str) -> tuple:  # noqa: WPS430
+        response, size = request(path)
+        return {
+            **response,
+            'version': '1.0',
+            'sections': {'description': 'text'},
+            'versions': {'1.0': 'link'},
+        }, size
+
+    wp._request = heavy_request  # type: ignore  # noqa: WPS437
+
+    list(wp.info())
+
+    assert wp.slug_index.get('first') == {'version': '1.0'}  # type: ignore
@@ -0,0 +1,76 @@
+"""Tests of the field selection."""
+# -*- coding: utf-8 -*-
+from typing import FrozenSet, Optional
+
+from singer import metadata
+from singer.catalog import Catalog, CatalogEntry
+
+from tap_wordpress_plugin_stats.cleaners import CLEANERS
+from tap_wordpress_plugin_stats.discover import discover
+from tap_wordpress_plugin_stats.selection import (  # noqa: I001
+    selected_fields,  # noqa: I001
+    selected_schema,  # noqa: I001
+    selection,  # noqa: I001
+)  # noqa: I001
+from tap_wordpress_plugin_stats.wordpress_plugin_stats import (  # noqa: I001
+    WordPressPluginStats,  # noqa: I001
+)  # noqa: I001
+
+
+def deselect(entry: CatalogEntry, *fields: str) -> None:
+    """Deselect fields of a catalog entry in its metadata.
+
+    Arguments:
+        entry {CatalogEntry} -- Catalog entry
+        fields {str} -- Fields
+    """
+    mdata: dict = metadata.to_map(entry.metadata)
+    for field in fields:
+        mdata = metadata.write(mdata, ('properties', field), 'selected', False)
+    entry.metadata = metadata.to_list(mdata)
+
+
+def test_all_fields_are_selected_by_default() -> None:
+    """Without deselected fields, every field of a stream is synced."""
+    catalog: Catalog = discover()
+
+    selected: dict = selection(catalog)
+
+    assert 'info' in selected
+    assert 'plugin_information' not in selected
+    assert all(fields is None for fields in selected.values())
+
+
+def test_deselected_fields_reduce_the_schema() -> None:
+    """Deselected fields are left out of the schema and the records."""
+    entry: CatalogEntry = discover().get_stream('info')
+    deselect(entry, 'plugin', 'downloaded', 'support_threads')
+
+    fields: Optional[FrozenSet[str]] = selected_fields(entry)
+
+    assert fields is not None
+    # The plugin identifies a record and can not be deselected
+    assert 'plugin' in fields
+    assert not fields & {'downloaded', 'support_threads'}
+    assert set(selected_schema(entry, fields)['properties']) == fields
+
+    record: tuple = CLEANERS['info'](
+        {'plugin': 'plugin', 'plugins': [{'downloaded': 10, 'rating': 90}]},
+        fields,
+    )
+    assert set(record._fields) == fields
+
+
+def test_deselected_fields_are_not_requested() -> None:
+    """The field flags only turn on the fields of the selected keys."""
+    entry: CatalogEntry = discover().get_stream('info')
+    deselect(entry, 'downloaded')
+    wp: WordPressPluginStats = WordPressPluginStats('plugin')
+
+    all_fields: str = wp._plugin_information_path('plugin')  # noqa: WPS437
+    wp.selection = {'info': selected_fields(entry)}
+    path: str = wp._plugin_information_path('plugin')  # noqa: WPS437
+
+    assert 'request[fields][downloaded]=1' in all_fields
+    assert 'request[fields][downloaded]=1' not in path
+    assert 'request[fields][rating]=1' in path
@@ -0,0 +1,82 @@
+"""Tests of the record validation."""
+# -*- coding: utf-8 -*-
+from typing import Tuple
+
+import pytest
+
+from tap_wordpress_plugin_stats.cleaners import CLEANERS, ConvertionError
+from tap_wordpress_plugin_stats.discover import discover
+from tap_wordpress_plugin_stats.validation import (  # noqa: I001
+    RecordValidationError,  # noqa: I001
+    RecordValidator,  # noqa: I001
+)  # noqa: I001
+
+FIELDS: Tuple[str, ...] = ('plugin', 'date', 'downloads')
+
+
+def validator(sample_rate: int = 1) -> RecordValidator:
+    """Create a validator of the downloads stream.
+
+    Keyword Arguments:
+        sample_rate {int} -- Validate 1 in N records (default: {1})
+
+    Returns:
+        RecordValidator -- Validator
+    """
+    schema: dict = discover().get_stream('downloads').schema.to_dict()
+    return RecordValidator('downloads', schema, FIELDS, sample_rate)
+
+
+def test_valid_records_pass() -> None:
+    """Records that match the schema are validated without errors."""
+    validate: RecordValidator = validator()
+
+    validate(('plugin', '2021-01-01', 10))
+    validate(('plugin', None, None))
+
+    assert validate.validated == 2
+
+
+@pytest.mark.parametrize('record', [
+    ('plugin', '2021-01-01', -1),
+    ('plugin', '2021-01-01', '10'),
+    ('plugin', 'yesterday', 10),
+    (None, '2021-01-01', 10),
+])
+def test_invalid_records_are_rejected(record: tuple) -> None:
+    """Records that do not match the schema raise an error."""
+    with pytest.raises(RecordValidationError):
+        validator()(record)
+
+
+def test_only_sampled_records_are_validated() -> None:
+    """With a sample rate of N, 1 in N records is validated."""
+    validate: RecordValidator = validator(sample_rate=2)
+
+    validate(('plugin', '2021-01-01', -1))
+    with pytest.raises(RecordValidationError):
+        validate(('plugin', '2021-01-01', -1))
+
+    assert validate.seen == 2
+    assert validate.validated == 1
+
+
+def test_fields_outside_the_schema_are_rejected() -> None:
+    """A field that the schema does not allow fails at compile time."""
+    schema: dict = discover().get_stream('downloads').schema.to_dict()
+
+    with pytest.raises(RecordValidationError):
+        RecordValidator('downloads', schema, (*FIELDS, 'unknown'))
+
+
+def test_cleaner_nulls_empty_values() -> None:
+    """Empty values are cleaned to None, unconvertible values raise."""
+    record: tuple = CLEANERS['downloads'](
+        {'plugin': 'plugin', 'date': '2021-01-01', 'downloads': ''},
+    )
+    assert record.downloads is None
+
+    with pytest.raises(ConvertionError):
+        CLEANERS['downloads'](
+            {'plugin': 'plugin', 'date': '2021-01-01', 'downloads': 'many'},
+        )